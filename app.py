@@ -162,7 +162,6 @@ def main ():
 
                     npc .update (dt ,floor_y =base )
                 fiddle .update (dt )
-                makersgun .update (dt ,npcs =npcs ,floor =base )
 
                 # Global drive input: if a possessed NPC is mounted on a bike,
                 # route A/D input to that bike so the player can drive it.
@@ -174,13 +173,13 @@ def main ():
                     if keys[pygame.K_d] or keys[pygame.K_RIGHT]:
                         vx += 220.0
 
+                    targets = []
                     if vx != 0.0:
                         # Collect bikes that currently have riders mounted
                         mounted_bikes = [b for b in makersgun.bricks if getattr(b, 'rider', None) is not None]
 
                         # Prefer bikes whose rider has been explicitly possessed
                         controlled = [n for n in npcs if getattr(n, 'possessed_controlled', False)]
-                        targets = []
                         if controlled:
                             targets = [b for b in mounted_bikes if b.rider in controlled]
 
@@ -197,17 +196,23 @@ def main ():
                                     mb = getattr(r, 'mounted_bike', None)
                                     if mb is not None:
                                         targets = [mb]
-
-                        for b in targets:
-                            try:
-                                if hasattr(b, 'drive'):
-                                    b.drive(vx, dt)
-                                else:
-                                    b.p.prev.x = b.p.pos.x - vx * dt
-                            except Exception:
-                                pass
                 except Exception:
-                    pass
+                    vx = 0.0
+                    targets = []
+
+                def drive_substep(sub):
+                    # the drive writes a Verlet velocity (prev = pos - v*dt), so
+                    # it has to be applied before every physics substep
+                    for b in targets:
+                        try:
+                            if hasattr(b, 'drive'):
+                                b.drive(vx, sub)
+                            else:
+                                b.p.prev.x = b.p.pos.x - vx * sub
+                        except Exception:
+                            pass
+
+                makersgun .update (dt ,npcs =npcs ,floor =base ,substep =drive_substep )
 
 
         # Update presence on transitions (menu <-> game). We only change the
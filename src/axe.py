@@ -26,16 +26,31 @@ class Axe:
 
         # radius in world space for detecting chops
         self.radius = 36
+        # icon scaled for the current screen size and the (icon, px) it is for
+        self._icon_img = None
+        self._icon_img_key = None
         # local blood manager for hit effects (optional)
         self.blood = BloodManager() if BloodManager is not None else None
 
+    def reset(self, pos, icon=None):
+        """Prepare a pooled axe for reuse at pos."""
+        self.pos = pygame.math.Vector2(pos)
+        self.held = False
+        self.icon = icon
+        if self.blood is not None:
+            self.blood.particles.clear()
+            self.blood.puddles.clear()
+
     def draw(self, surf):
         center = scaling.to_screen_vec(self.pos)
         if self.icon is not None:
             ps = max(24, scaling.to_screen_length(36))
             try:
-                img = pygame.transform.scale(self.icon, (ps, ps))
-                surf.blit(img, (int(center.x - ps // 2), int(center.y - ps // 2)))
+                key = (id(self.icon), ps)
+                if key != self._icon_img_key:
+                    self._icon_img = pygame.transform.scale(self.icon, (ps, ps))
+                    self._icon_img_key = key
+                surf.blit(self._icon_img, (int(center.x - ps // 2), int(center.y - ps // 2)))
                 return
             except Exception:
                 pass
@@ -160,7 +160,7 @@ def resolve_particle_vs_aabb(particle, aabb_center, aabb_size, radius=None, boun
     particle.prev = particle.pos - vel
 
 
-def collide_particles_with_bricks(particles, bricks, particle_radius=None, bounce=0.0, friction=0.6, iterations=1):
+def collide_particles_with_bricks(particles, bricks, particle_radius=None, bounce=0.0, friction=0.6, iterations=1, spatial_index=None):
     """Resolve collisions between a list of particles and maker bricks.
 
     Parameters:
@@ -168,13 +168,19 @@ def collide_particles_with_bricks(particles, bricks, particle_radius=None, bounc
         bricks: iterable of objects with .p (Particle with .pos) and .size
         particle_radius: default collision radius for particles (None => infer per-particle)
         iterations: number of solver passes (higher -> more stable)
+        spatial_index: optional SpatialHash over `bricks`; when given each
+            particle only tests bricks in its cell and the 8 neighbours
     """
     if not bricks:
         return
 
     for _ in range(max(1, int(iterations))):
         for p in particles:
-            for b in bricks:
+            if spatial_index is not None:
+                near = spatial_index.query_point(p.pos.x, p.pos.y)
+            else:
+                near = bricks
+            for b in near:
                 try:
                     center = (b.p.pos.x, b.p.pos.y)
                     size = getattr(b, 'size', None)
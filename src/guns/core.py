@@ -69,6 +69,28 @@ class Gun:
         self.fire_rate = 1.0
         # flip indicates whether mouse direction should be inverted
         self.flip = False
+        # icon scaled for the current screen size and the (icon, px) it is for
+        self._icon_img = None
+        self._icon_img_key = None
+
+    def _scaled_icon(self, ps):
+        """Return self.icon scaled to ps x ps, re-scaling only when either changes."""
+        key = (id(self.icon), ps)
+        if key != self._icon_img_key:
+            self._icon_img = pygame.transform.scale(self.icon, (ps, ps))
+            self._icon_img_key = key
+        return self._icon_img
+
+    def reset(self, pos, icon=None):
+        """Prepare a pooled gun for reuse at pos (clears bullets/cooldown)."""
+        try:
+            self.pos = pygame.math.Vector2(pos)
+        except Exception:
+            self.pos = pygame.math.Vector2((0, 0))
+        self.icon = icon
+        self.held = False
+        self.bullets = []
+        self._cooldown = 0.0
 
     def shoot(self, target_world_pos):
         """Fire towards target. Default does nothing."""
@@ -103,7 +125,7 @@ class Gun:
         try:
             if self.icon is not None:
                 ps = max(12, 20)
-                img = pygame.transform.scale(self.icon, (ps, ps))
+                img = self._scaled_icon(ps)
                 center = pygame.math.Vector2(self.pos)
                 surf.blit(img, (int(center.x - ps // 2), int(center.y - ps // 2)))
         except Exception:
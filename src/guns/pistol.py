@@ -236,6 +236,11 @@ class Pistol(Gun):
         # default flip behavior (matches previous behavior)
         self.flip = True
 
+    def reset(self, pos, icon=None):
+        super().reset(pos, icon)
+        self.blood.particles.clear()
+        self.blood.puddles.clear()
+
     def shoot(self, target_world_pos):
         if self._cooldown > 0:
             return
@@ -299,7 +304,7 @@ class Pistol(Gun):
             center = scaling.to_screen_vec(self.pos)
             if self.icon is not None:
                 ps = max(12, scaling.to_screen_length(20))
-                img = pygame.transform.scale(self.icon, (ps, ps))
+                img = self._scaled_icon(ps)
                 surf.blit(img, (int(center.x - ps // 2), int(center.y - ps // 2)))
             else:
                 pygame.draw.circle(
@@ -1,7 +1,98 @@
+import math
+from collections import deque
+from functools import lru_cache
 import pygame
 from src import scaling
 from src.npc import Particle
 
+# downward acceleration applied to free bricks (world px/s^2)
+GRAVITY_Y = 900.0
+
+# bumped on every weld/unweld so roots cached by Brick.get_root go stale
+_WELD_REV = 0
+
+# longest weld chain get_root will follow
+_MAX_WELD_DEPTH = 64
+
+
+def _bump_weld_rev():
+    global _WELD_REV
+    _WELD_REV += 1
+
+
+MORTAR_COLOR = (220, 220, 220)
+
+
+@lru_cache(maxsize=32)
+def _mortar_rects(width, height, mortar_thickness):
+    """Return the mortar layout for an inner area of width x height.
+
+    Segments are (x, y, w, h) tuples relative to the inner rect's top-left;
+    memoized per (width, height, mortar_thickness).
+    """
+    rects = []
+    inner = pygame.Rect(0, 0, width, height)
+
+    # Determine rows/cols based on pixel size for a reasonable look
+    pw = max(2, width)  # pixel width
+    ph = max(2, height)
+    rows = max(2, pw // 20)
+    cols = max(2, pw // 15)
+
+    brick_h = ph / rows
+    brick_w = width / cols
+
+    # Horizontal mortar lines
+    for r in range(rows + 1):
+        y = int(round(r * brick_h))
+        rects.append((0, y - mortar_thickness // 2, width, mortar_thickness))
+
+    # Vertical mortar lines for each row, staggered every other row
+    for r in range(rows):
+        row_top = int(round(r * brick_h))
+        row_h = int(round(brick_h))
+        offset = 0 if (r % 2) == 0 else int(round(brick_w / 2))
+
+        # start a bit left to ensure full coverage when offset is used
+        start_x = -offset
+        c = 0
+        while True:
+            x = start_x + int(round(c * brick_w))
+            if x > inner.right:
+                break
+            # keep the segment inside the inner area
+            seg_rect = pygame.Rect(x - mortar_thickness // 2, row_top, mortar_thickness, row_h)
+            seg_rect.clamp_ip(inner)
+            if seg_rect.width > 0 and seg_rect.height > 0:
+                rects.append(tuple(seg_rect))
+            c += 1
+
+    return tuple(rects)
+
+
+@lru_cache(maxsize=32)
+def _brick_sprite(width, height, color, outline, border_radius, inset, mortar_thickness):
+    """Render outline + fill + mortar once into a Surface of width x height."""
+    if border_radius:
+        # rounded corners need transparent pixels outside the outline
+        sprite = pygame.Surface((width, height), pygame.SRCALPHA)
+    else:
+        sprite = pygame.Surface((width, height))
+    rect = sprite.get_rect()
+    pygame.draw.rect(sprite, outline, rect, border_radius=border_radius)
+    inner = rect.inflate(-inset, -inset)
+    pygame.draw.rect(sprite, color, inner, border_radius=max(0, border_radius - 1))
+    left = inner.left
+    top = inner.top
+    for x, y, w, h in _mortar_rects(inner.width, inner.height, mortar_thickness):
+        pygame.draw.rect(sprite, MORTAR_COLOR, (left + x, top + y, w, h))
+    try:
+        sprite = sprite.convert_alpha() if border_radius else sprite.convert()
+    except Exception:
+        # no display mode set yet; the unconverted surface still blits
+        pass
+    return sprite
+
 
 class Brick:
     """A simple square 'lego-like' brick backed by a single Verlet particle.
@@ -19,207 +110,256 @@ class Brick:
         # position with a fixed offset.
         self.welded_to = None
         self.welded_offset = pygame.math.Vector2(0, 0)
-        # children welded to this brick (so we can move/iterate group)
-        self.welded_children = []
+        # children welded to this brick (so we can move/iterate group);
+        # a set so weld/unweld bookkeeping is O(1)
+        self.welded_children = set()
+        # update variant matching the current weld state; swapped by
+        # add_weld/remove_weld so update() never re-checks it
+        self._update_fn = self._update_free
+        # get_root() result, valid while _root_rev == _WELD_REV
+        self._root_cache = None
+        self._root_rev = -1
+        # get_descendants() result, valid while _desc_rev == _WELD_REV
+        self._desc_cache = []
+        self._desc_rev = -1
+        # pre-rendered sprite, the (scale version, size, colors) it was
+        # rendered for and its on-screen side length
+        self._sprite = None
+        self._sprite_key = None
+        self._sprite_px = 0
 
     def get_root(self):
-        """Return the top-most ancestor in the welded chain (self if none)."""
+        """Return the top-most ancestor in the welded chain (self if none).
+
+        The result is cached until any weld in the world changes; a miss
+        also caches the root on every ancestor it walks through.
+        """
+        rev = _WELD_REV
+        if self._root_rev == rev:
+            return self._root_cache
         cur = self
-        seen = set()
-        while getattr(cur, 'welded_to', None) is not None:
-            # defensive: break cycles
-            if id(cur) in seen:
+        path = []
+        # hop limit instead of a visited set: add_weld never builds cycles,
+        # this only keeps a corrupted chain from spinning forever
+        for _ in range(_MAX_WELD_DEPTH):
+            # thrusters/vehicles can be weld parents but carry no weld state
+            parent = getattr(cur, 'welded_to', None)
+            if parent is None:
                 break
-            seen.add(id(cur))
-            cur = cur.welded_to
+            # an ancestor resolved earlier this revision already knows the root
+            if cur is not self and getattr(cur, '_root_rev', -1) == rev:
+                cur = cur._root_cache
+                break
+            path.append(cur)
+            cur = parent
+        # every brick on the walked chain shares the same root
+        for b in path:
+            b._root_cache = cur
+            b._root_rev = rev
+        self._root_cache = cur
+        self._root_rev = rev
         return cur
 
+    def get_descendants(self):
+        """Return all bricks welded below this one, parents before children.
+
+        Cached until any weld in the world changes, so dragging a rigid
+        assembly doesn't re-walk the weld tree every frame.
+        """
+        if self._desc_rev == _WELD_REV:
+            return self._desc_cache
+        out = []
+        queue = deque(self.welded_children)
+        while queue:
+            child = queue.popleft()
+            out.append(child)
+            queue.extend(child.welded_children)
+        self._desc_cache = out
+        self._desc_rev = _WELD_REV
+        return out
+
     def add_weld(self, parent, offset=None):
-        """Weld this brick to parent. Handles list bookkeeping."""
-        try:
-            if getattr(self, 'welded_to', None) is not None and self.welded_to is not parent:
-                try:
-                    self.welded_to.welded_children.remove(self)
-                except Exception:
-                    pass
-        except Exception:
-            pass
+        """Weld this brick to parent (a Brick, thruster or vehicle)."""
+        if self.welded_to is not None and self.welded_to is not parent:
+            self._detach_from_parent()
         self.welded_to = parent
         if offset is None:
-            try:
-                self.welded_offset = self.p.pos - parent.p.pos
-            except Exception:
-                self.welded_offset = pygame.math.Vector2(0, 0)
+            self.welded_offset = self.p.pos - parent.p.pos
         else:
             self.welded_offset = offset
-        try:
-            if self not in parent.welded_children:
-                parent.welded_children.append(self)
-        except Exception:
-            pass
+        children = getattr(parent, 'welded_children', None)
+        if children is not None:
+            children.add(self)
+        self._update_fn = self._update_welded
+        _bump_weld_rev()
 
     def remove_weld(self):
         """Unweld this brick from its parent (if any)."""
-        try:
-            if getattr(self, 'welded_to', None) is not None:
-                try:
-                    self.welded_to.welded_children.remove(self)
-                except Exception:
-                    pass
-        except Exception:
-            pass
+        if self.welded_to is not None:
+            self._detach_from_parent()
+            _bump_weld_rev()
         self.welded_to = None
+        self._update_fn = self._update_free
+
+    def _detach_from_parent(self):
+        children = getattr(self.welded_to, 'welded_children', None)
+        if children is not None:
+            children.discard(self)
 
     def apply_force(self, f):
         self.p.apply_force(f)
 
-    def update(self, dt, floor_y=None, other_bricks=None):
-
-        # If welded to another brick, follow that brick and don't simulate
-        # independent physics. We'll still return early so stacked bricks
-        # remain locked in place relative to their parent.
-        if self.welded_to is not None:
-            try:
-                # If the target was removed, un-weld
-                if other_bricks is not None and self.welded_to not in other_bricks:
-                    self.remove_weld()
-                else:
-                    parent = self.welded_to
-                    self.p.pos = parent.p.pos + self.welded_offset
-                    parent_vel = parent.p.pos - parent.p.prev
-                    self.p.prev = self.p.pos - parent_vel
-            except Exception:
-                self.remove_weld()
-
-        gravity = pygame.math.Vector2(0, 900)
-        self.p.apply_force(gravity * self.p.mass)
-        self.p.update(dt)
-
+    def update(self, dt, floor_y=None, other_bricks=None, spatial_index=None):
+        """Advance the brick by dt.
+
+        Dispatches to `_update_free` or `_update_welded` depending on the
+        weld state, so the common unwelded case runs without weld checks.
+        When `spatial_index` (a SpatialHash over other_bricks) is given,
+        only objects in nearby cells are tested for collision.
+        """
+        self._update_fn(dt, floor_y, other_bricks, spatial_index)
+
+    def _update_welded(self, dt, floor_y=None, other_bricks=None, spatial_index=None):
+        """Follow the parent brick; no gravity, floor or pair collisions."""
+        parent = self.welded_to
+        # If the target was removed, un-weld and simulate freely again
+        if other_bricks is not None and parent not in other_bricks:
+            self.remove_weld()
+            self._update_free(dt, floor_y, other_bricks, spatial_index)
+            return
+        pp = parent.p.pos
+        ppr = parent.p.prev
+        off = self.welded_offset
+        x = pp.x + off.x
+        y = pp.y + off.y
+        self.p.pos.update(x, y)
+        # carry the parent's velocity
+        self.p.prev.update(x - (pp.x - ppr.x), y - (pp.y - ppr.y))
+        # forces (e.g. thrusters) don't move a welded brick on its own
+        self.p.acc.update(0, 0)
+
+    def _update_free(self, dt, floor_y=None, other_bricks=None, spatial_index=None):
+        p = self.p
+        pos = p.pos
+        prev = p.prev
+        acc = p.acc
+
+        fy = None
         if floor_y is not None:
             if hasattr(floor_y, 'get_floor_y'):
                 fy = floor_y.get_floor_y()
             else:
                 fy = floor_y
-            if fy is not None and self.p.pos.y > fy - (self.size / 2):
-                self.p.pos.y = fy - (self.size / 2)
-                if hasattr(floor_y, 'get_friction'):
-                    friction = floor_y.get_friction()
-                else:
-                    friction = 0.35
-
-                vel = self.p.pos - self.p.prev
-                vel.y = 0
-                vel.x *= friction
-                self.p.prev = self.p.pos - vel
+
+        # Verlet step, gravity and floor contact in one pass over floats;
+        # pos/prev are written once at the end
+        dt2 = dt * dt
+        px = pos.x
+        py = pos.y
+        vx = px - prev.x + acc.x * dt2
+        vy = py - prev.y + (acc.y + GRAVITY_Y) * dt2
+        nx = px + vx
+        ny = py + vy
+        acc.update(0, 0)
+        if fy is not None and ny > fy - self.size * 0.5:
+            ny = fy - self.size * 0.5
+            if hasattr(floor_y, 'get_friction'):
+                friction = floor_y.get_friction()
+            else:
+                friction = 0.35
+            # kill vertical velocity, damp horizontal
+            prev.update(nx - vx * friction, ny)
+        else:
+            prev.update(px, py)
+        pos.update(nx, ny)
 
         if other_bricks:
-            for other in other_bricks:
-                if other != self:
-                    # skip internal collisions within a welded group
-                    try:
-                        if hasattr(self, 'get_root') and hasattr(other, 'get_root'):
-                            if self.get_root() is other.get_root():
-                                continue
-                    except Exception:
-                        pass
-
-                    diff = self.p.pos - other.p.pos
-                    dist = diff.length()
-                    min_dist = (self.size + other.size) / 2
-
-                    if dist < min_dist and dist > 0:
-                        norm = diff / dist
-                        overlap = min_dist - dist
-                        total_mass = self.p.mass + other.p.mass
-                        self_ratio = other.p.mass / total_mass
-                        other_ratio = self.p.mass / total_mass
-
-                        self.p.pos += norm * overlap * self_ratio
-
-                        self_vel = self.p.pos - self.p.prev
-                        other_vel = other.p.pos - other.p.prev
-                        rel_vel = self_vel - other_vel
-                        vel_along_normal = rel_vel.dot(norm)
-
-                        if vel_along_normal < 0:
-                            restitution = 0.3
-                            j = -(1 + restitution) * vel_along_normal
-                            j /= 1 / self.p.mass + 1 / other.p.mass
-
-                            impulse = norm * j
-
-                            self.p.prev = self.p.pos - (self_vel + (impulse / self.p.mass))
-                            other.p.prev = other.p.pos - (other_vel - (impulse / other.p.mass))
-
-                        # Simple "snap/weld" behavior
-                        try:
-                            rel_speed = rel_vel.length()
-                            vertical_indicator = norm.y
-                            horiz_sep = abs(diff.x)
-                            horiz_tol = (self.size + other.size) * 0.35
-                            if vertical_indicator < -0.7 and rel_speed < 120 and horiz_sep < horiz_tol:
-                                try:
-                                    self.add_weld(other)
-                                    parent_vel = other.p.pos - other.p.prev
-                                    self.p.prev = self.p.pos - parent_vel
-                                except Exception:
-                                    self.welded_to = other
-                                    self.welded_offset = self.p.pos - other.p.pos
-                                    self.p.prev = self.p.pos.copy()
-                        except Exception:
-                            pass
+            if spatial_index is not None:
+                s = self.size
+                near = spatial_index.query(pygame.Rect(int(pos.x - s), int(pos.y - s), int(s * 2), int(s * 2)))
+            else:
+                near = other_bricks
+            root = self.get_root()
+            # own half-extent is loop-invariant; only other.size varies
+            half = self.size * 0.5
+            for other in near:
+                if other is not self:
+                    op = other.p
+                    min_dist = half + other.size * 0.5
+                    # cheap per-axis reject before any sqrt
+                    dx = pos.x - op.pos.x
+                    if dx > min_dist or dx < -min_dist:
+                        continue
+                    dy = pos.y - op.pos.y
+                    if dy > min_dist or dy < -min_dist:
+                        continue
+                    d2 = dx * dx + dy * dy
+                    if d2 >= min_dist * min_dist or d2 == 0:
+                        continue
+
+                    # skip internal collisions within a welded group; a
+                    # thruster/vehicle can only ever be the group's root
+                    if other is root or (isinstance(other, Brick) and other.get_root() is root):
+                        continue
+
+                    dist = math.sqrt(d2)
+                    inv = 1.0 / dist
+                    nx = dx * inv
+                    ny = dy * inv
+                    inv_i = p.inv_mass
+                    inv_j = op.inv_mass
+                    inv_sum = inv_i + inv_j
+                    # push self out by its share of the overlap
+                    push = (min_dist - dist) * inv_i / inv_sum
+                    pos.x += nx * push
+                    pos.y += ny * push
+
+                    svx = pos.x - prev.x
+                    svy = pos.y - prev.y
+                    ovx = op.pos.x - op.prev.x
+                    ovy = op.pos.y - op.prev.y
+                    rvx = svx - ovx
+                    rvy = svy - ovy
+                    vel_along_normal = rvx * nx + rvy * ny
+
+                    if vel_along_normal < 0:
+                        restitution = 0.3
+                        j = -(1 + restitution) * vel_along_normal / inv_sum
+
+                        si = j * inv_i
+                        oi = j * inv_j
+                        prev.update(pos.x - (svx + nx * si), pos.y - (svy + ny * si))
+                        op.prev.update(op.pos.x - (ovx - nx * oi), op.pos.y - (ovy - ny * oi))
+
+                    # Simple "snap/weld" behavior: resting on top of other
+                    if ny < -0.7 and abs(dx) < min_dist * 0.7 and rvx * rvx + rvy * rvy < 14400.0:
+                        self.add_weld(other)
+                        root = self.get_root()
+                        prev.update(pos.x - (op.pos.x - op.prev.x), pos.y - (op.pos.y - op.prev.y))
 
     def draw(self, surf):
-        center = scaling.to_screen_vec(self.p.pos)
-        s = scaling.to_screen_length(self.size)
-        rect = pygame.Rect(0, 0, int(s), int(s))
-        rect.center = (int(center.x), int(center.y))
-        pygame.draw.rect(surf, self.outline, rect)
-        # inner drawing area (accounts for outline thickness)
-        inner = rect.inflate(-max(2, int(scaling.to_screen_length(3))), -max(2, int(scaling.to_screen_length(3))))
-
-        # Base brick color fill
-        pygame.draw.rect(surf, self.color, inner)
-
-        # Brick pattern: staggered rows with light mortar lines
-        mortar_color = (220, 220, 220)
-        mortar_thickness = max(1, int(scaling.to_screen_length(2)))
+        surf.blit(*self.blit_args())
 
-        # Determine rows/cols based on pixel size for a reasonable look
-        pw = max(2, inner.width)  # pixel width
-        ph = max(2, inner.height)
-        rows = max(2, pw // 20)
-        cols = max(2, pw // 15)
-
-        brick_h = ph / rows
-        brick_w = inner.width / cols
-
-        # Draw horizontal mortar lines
-        for r in range(rows + 1):
-            y = inner.top + int(round(r * brick_h))
-            pygame.draw.rect(surf, mortar_color, pygame.Rect(inner.left, y - mortar_thickness // 2, inner.width, mortar_thickness))
-
-        # Draw vertical mortar lines for each row, staggered every other row
-        for r in range(rows):
-            row_top = inner.top + int(round(r * brick_h))
-            row_h = int(round(brick_h))
-            offset = 0 if (r % 2) == 0 else int(round(brick_w / 2))
-
-            # start a bit left to ensure full coverage when offset is used
-            start_x = inner.left - offset
-            # draw vertical separators across the row
-            c = 0
-            while True:
-                x = start_x + int(round(c * brick_w))
-                if x > inner.right:
-                    break
-                # Draw the vertical mortar segment clipped to the row height
-                seg_rect = pygame.Rect(x - mortar_thickness // 2, row_top, mortar_thickness, row_h)
-                # Clip the rect to inner area to avoid drawing outside
-                seg_rect.clamp_ip(inner)
-                if seg_rect.width > 0 and seg_rect.height > 0:
-                    pygame.draw.rect(surf, mortar_color, seg_rect)
-                c += 1
+    def blit_args(self):
+        """Return (sprite, dest) for drawing this brick on screen.
+
+        Lets the caller collect many bricks and submit them with a single
+        Surface.blits call.
+        """
+        center = scaling.to_screen_vec(self.p.pos)
+        key = (scaling.get_scale_version(), self.size, self.color, self.outline)
+        if key != self._sprite_key:
+            # screen sizes only change with the scale, size or colors
+            s = int(scaling.to_screen_length(self.size))
+            # outline thickness and mortar width in pixels
+            inset = max(2, int(scaling.to_screen_length(3)))
+            mortar_thickness = max(1, int(scaling.to_screen_length(2)))
+            self._sprite = _brick_sprite(s, s, tuple(self.color), tuple(self.outline), 0, inset, mortar_thickness)
+            self._sprite_key = key
+            self._sprite_px = s
+        # top-left as a plain tuple; same placement as Rect.center would give
+        h = self._sprite_px // 2
+        return self._sprite, (int(center.x) - h, int(center.y) - h)
 
 
 def draw_brick_pattern(surf, rect, color=None, outline=None, border_radius=4):
@@ -234,46 +374,10 @@ def draw_brick_pattern(surf, rect, color=None, outline=None, border_radius=4):
         if outline is None:
             outline = (30, 10, 10)
 
-        # Outline
-        pygame.draw.rect(surf, outline, rect, border_radius=border_radius)
-
-        # Inner area
-        inner = rect.inflate(-max(2, int(scaling.to_screen_length(3))), -max(2, int(scaling.to_screen_length(3))))
-        pygame.draw.rect(surf, color, inner, border_radius=max(0, border_radius - 1))
-
-        # Brick pattern (mortar lines)
-        mortar_color = (220, 220, 220)
+        inset = max(2, int(scaling.to_screen_length(3)))
         mortar_thickness = max(1, int(scaling.to_screen_length(2)))
-
-        pw = max(2, inner.width)
-        ph = max(2, inner.height)
-        rows = max(2, pw // 20)
-        cols = max(2, pw // 15)
-
-        brick_h = ph / rows
-        brick_w = inner.width / cols
-
-        # Horizontal mortar
-        for r in range(rows + 1):
-            y = inner.top + int(round(r * brick_h))
-            pygame.draw.rect(surf, mortar_color, pygame.Rect(inner.left, y - mortar_thickness // 2, inner.width, mortar_thickness))
-
-        # Vertical mortar per row (staggered)
-        for r in range(rows):
-            row_top = inner.top + int(round(r * brick_h))
-            row_h = int(round(brick_h))
-            offset = 0 if (r % 2) == 0 else int(round(brick_w / 2))
-            start_x = inner.left - offset
-            c = 0
-            while True:
-                x = start_x + int(round(c * brick_w))
-                if x > inner.right:
-                    break
-                seg_rect = pygame.Rect(x - mortar_thickness // 2, row_top, mortar_thickness, row_h)
-                seg_rect.clamp_ip(inner)
-                if seg_rect.width > 0 and seg_rect.height > 0:
-                    pygame.draw.rect(surf, mortar_color, seg_rect)
-                c += 1
+        sprite = _brick_sprite(rect.width, rect.height, tuple(color), tuple(outline), border_radius, inset, mortar_thickness)
+        surf.blit(sprite, rect)
     except Exception:
         # Best-effort: fallback to simple rect if pattern drawing fails
         try:
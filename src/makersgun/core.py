@@ -1,5 +1,7 @@
+import math
 import os
 import random
+from functools import lru_cache
 import pygame
 from src import scaling
 from src.npc import NPC
@@ -8,6 +10,116 @@ from src import colison
 from .brick import Brick, draw_brick_pattern
 from .crate import Crate, draw_crate_pattern
 from . import objdestroy
+from . import physics
+
+# tools, vehicles and guns are optional; resolve them once at import
+# rather than on every update/draw
+try:
+    from src.vehicles.bike import Bike
+except Exception:
+    Bike = None
+try:
+    from src.vehicles.car import Car
+except Exception:
+    Car = None
+try:
+    from src.thruster import Thruster
+except Exception:
+    Thruster = None
+try:
+    from src.wield import WeldingTool
+except Exception:
+    WeldingTool = None
+try:
+    from src.axe import Axe
+except Exception:
+    Axe = None
+try:
+    from src.guns.core import create_gun
+except Exception:
+    create_gun = None
+
+
+_ASSET_DIR = os.path.join(os.path.dirname(__file__), 'assets')
+
+# file name -> converted icon Surface, shared by every MakersGun; only
+# successful loads are stored so a missing display can be retried later
+_ICON_CACHE = {}
+
+
+def _load_icon(name):
+    """Return the icon `name` from the assets folder, or None if unavailable."""
+    icon = _ICON_CACHE.get(name)
+    if icon is not None:
+        return icon
+    path = os.path.join(_ASSET_DIR, name)
+    if not os.path.exists(path):
+        return None
+    try:
+        icon = pygame.image.load(path).convert_alpha()
+    except Exception:
+        return None
+    _ICON_CACHE[name] = icon
+    return icon
+
+
+def _as_xy(pos):
+    """Return a world position (tuple, list or Vector2) as two floats."""
+    x, y = pos
+    return float(x), float(y)
+
+
+def _record_spawn(kind, world_pos, size):
+    """Add a spawned object to the current world's save data, if one is loaded."""
+    try:
+        mgr = get_world_manager()
+        if mgr.current_name:
+            x, y = _as_xy(world_pos)
+            mgr.add_brick({"type": kind, "x": x, "y": y, "size": size})
+    except Exception:
+        pass
+
+
+def _part_radius(vehicle, part):
+    """Collision radius of one vehicle particle (wheels are the largest)."""
+    size = float(getattr(vehicle, 'size', 40))
+    if part is getattr(vehicle, 'front_wheel', None) or part is getattr(vehicle, 'back_wheel', None):
+        return size * 0.15
+    if part is getattr(vehicle, 'seat', None):
+        return size * 0.09
+    return size * 0.12
+
+
+@lru_cache(maxsize=16)
+def _font(size_px, name='Arial'):
+    """Return a cached SysFont; SysFont looks the font up on every call."""
+    return pygame.font.SysFont(name, size_px)
+
+
+@lru_cache(maxsize=32)
+def _npc_head_sprite(hs, inset, eye_w, radius):
+    """Render the NPC head preview (outline, fill, left eye) into an hs x hs Surface."""
+    sprite = pygame.Surface((hs, hs), pygame.SRCALPHA)
+    head_rect = sprite.get_rect()
+    pygame.draw.rect(sprite, (16, 40, 18), head_rect, border_radius=radius)
+    inner = head_rect.inflate(-inset, -inset)
+    pygame.draw.rect(sprite, (54, 160, 60), inner, border_radius=radius - 1)
+    # same pixel the eye lands on when drawn around an integer centre
+    eye_x = hs // 2 - math.ceil(hs * 0.16)
+    eye_y = hs // 2 - math.ceil(hs * 0.12)
+    pygame.draw.rect(sprite, (10, 10, 10), pygame.Rect(eye_x, eye_y, eye_w, eye_w))
+    try:
+        sprite = sprite.convert_alpha()
+    except Exception:
+        # no display mode set yet; the unconverted surface still blits
+        pass
+    return sprite
+
+
+@lru_cache(maxsize=128)
+def _render_text(font, text, color):
+    """Return a cached antialiased render of text in font (from _font())."""
+    return font.render(text, True, color)
 
 
 class MakersGun:
@@ -20,6 +132,23 @@ class MakersGun:
         draw(surf)
     """
 
+    # released tool objects kept for reuse, by kind; see _get_tool
+    _TOOL_POOL = {'pistol': [], 'axe': [], 'weld': []}
+
+    # every attribute set in __init__; no per-instance __dict__
+    __slots__ = (
+        'target', 'offset', 'dragging', 'equipped', 'menu_open', 'menu_selected',
+        '_prev_cursor_visible', 'bricks',
+        'welding_tool', 'pistol', 'ak47', 'axe',
+        '_welding_tool_obj', '_pistol_obj', '_ak47_obj', '_axe_obj',
+        '_scaled_icon_cache', '_scaled_preview_size',
+        'icon', 'welding_icon', 'pistol_icon', 'ak47_icon', 'car_icon', 'thruster_icon', 'axe_icon',
+        'menu_w', 'menu_h', 'menu_tabs', 'menu_tab_items', 'menu_tab_selected', 'menu_tab_h',
+        '_menu_geom_cache', '_menu_bg', '_menu_bg_key', '_menu_ui', '_menu_ui_key', '_menu_click_spawners', '_place_spawners',
+        'menu_anim', 'menu_anim_target', 'menu_anim_speed', '_hover_progress',
+        '_preview_vehicle_colors', '_fixed_dt', '_max_substeps',
+    )
+
     def __init__(self):
         self.target = None
         self.offset = pygame.math.Vector2(0, 0)
@@ -38,59 +167,67 @@ class MakersGun:
         self.welding_tool = None
         self.pistol = None
         self.ak47 = None
-        self.thruster_icon = None
         self.axe = None
-        self.axe_icon = None
-        self.ak47_icon = None
-
-        self.icon = None
-        self.welding_icon = None
-        self.pistol_icon = None
-        self.car_icon = None
-        try:
-            base = os.path.join(os.path.dirname(__file__), 'assets')
-
-            path = os.path.join(base, 'makergun.png')
-            if os.path.exists(path):
-                self.icon = pygame.image.load(path).convert_alpha()
-            weld_path = os.path.join(base, 'weldingtool.png')
-            if os.path.exists(weld_path):
-                self.welding_icon = pygame.image.load(weld_path).convert_alpha()
-            pistol_path = os.path.join(base, 'pistol.png')
-            if os.path.exists(pistol_path):
-                self.pistol_icon = pygame.image.load(pistol_path).convert_alpha()
-            ak47_path = os.path.join(base, 'ak47.png')
-            if os.path.exists(ak47_path):
-                self.ak47_icon = pygame.image.load(ak47_path).convert_alpha()
-            car_path = os.path.join(base, 'car.png')
-            if os.path.exists(car_path):
-                try:
-                    self.car_icon = pygame.image.load(car_path).convert_alpha()
-                except Exception:
-                    self.car_icon = None
-            thruster_path = os.path.join(base, 'thruster.png')
-            if os.path.exists(thruster_path):
-                self.thruster_icon = pygame.image.load(thruster_path).convert_alpha()
-            axe_path = os.path.join(base, 'axe.png')
-            if os.path.exists(axe_path):
-                self.axe_icon = pygame.image.load(axe_path).convert_alpha()
-        except Exception:
-            self.icon = None
-            self.welding_icon = None
-
+        # live tool objects behind the welding_tool/pistol/ak47/axe dicts
+        self._welding_tool_obj = None
+        self._pistol_obj = None
+        self._ak47_obj = None
+        self._axe_obj = None
+        # (id(icon), size) -> scaled icon Surface, see _get_scaled; cleared
+        # when the menu preview size changes (window resize)
+        self._scaled_icon_cache = {}
+        self._scaled_preview_size = None
+
+        # icons are loaded once per process and shared between instances
+        self.icon = _load_icon('makergun.png')
+        self.welding_icon = _load_icon('weldingtool.png')
+        self.pistol_icon = _load_icon('pistol.png')
+        self.ak47_icon = _load_icon('ak47.png')
+        self.car_icon = _load_icon('car.png')
+        self.thruster_icon = _load_icon('thruster.png')
+        self.axe_icon = _load_icon('axe.png')
 
         self.menu_w = 96
         self.menu_h = 40
         # Tabs for spawn menu (add Vehicles category)
-        self.menu_tabs = ['Objects', 'Vehicles', 'Weapons', 'Items']
+        # tuples: the layout cache in _menu_geom hands these out directly
+        self.menu_tabs = ('Objects', 'Vehicles', 'Weapons', 'Items')
         self.menu_tab_items = {
-            'Objects': ['Brick', 'Crate', 'NPC'],
-            'Vehicles': ['Bike', 'Car'],
-            'Weapons': ['Wielding Tool', 'Pistol', 'AK47', 'Axe'],
-            'Items': ['Thruster']
+            'Objects': ('Brick', 'Crate', 'NPC'),
+            'Vehicles': ('Bike', 'Car'),
+            'Weapons': ('Wielding Tool', 'Pistol', 'AK47', 'Axe'),
+            'Items': ('Thruster',)
         }
         self.menu_tab_selected = 0
         self.menu_tab_h = 28
+        # (key, geometry) from _menu_geom; key is the screen size and tab
+        self._menu_geom_cache = None
+        # panel background (frame, header, tabs, empty cells) and its layout key
+        self._menu_bg = None
+        self._menu_bg_key = None
+        # last rendered menu panel and the draw state it was rendered for
+        self._menu_ui = None
+        self._menu_ui_key = None
+        # menu item name -> handler(world_pos, npcs). Items in the first
+        # table spawn (and equip) as soon as they are clicked in the menu;
+        # the second places the selected item on right click.
+        self._menu_click_spawners = {
+            'Wielding Tool': lambda pos, npcs: self.spawn_welding_tool(pos),
+            'Pistol': lambda pos, npcs: self.spawn_pistol(pos, auto_equip=True),
+            'Axe': lambda pos, npcs: self.spawn_axe(pos, auto_equip=True),
+            'NPC': self._spawn_npc,
+        }
+        self._place_spawners = {
+            'Brick': lambda pos, npcs: self.spawn_brick(pos),
+            'Crate': lambda pos, npcs: self.spawn_crate(pos),
+            'Wielding Tool': lambda pos, npcs: self.spawn_welding_tool(pos),
+            'Pistol': lambda pos, npcs: self.spawn_pistol(pos),
+            'Axe': lambda pos, npcs: self.spawn_axe(pos),
+            'Thruster': lambda pos, npcs: self.spawn_thruster(pos),
+            'Bike': lambda pos, npcs: self.spawn_bike(pos),
+            'Car': lambda pos, npcs: self.spawn_car(pos),
+            'NPC': self._spawn_npc,
+        }
         # menu animation state (0.0 closed -> 1.0 open)
         self.menu_anim = 0.0
         self.menu_anim_target = 0.0
@@ -100,6 +237,10 @@ class MakersGun:
         # vehicle preview colors chosen when the spawn menu is opened
         # keys are vehicle names (e.g. 'Car', 'Bike') -> RGB tuples
         self._preview_vehicle_colors = {}
+        # physics substep target: each frame is split into equal substeps
+        # of about _fixed_dt (at most _max_substeps of them)
+        self._fixed_dt = 1.0 / 60.0
+        self._max_substeps = 8
 
     def _draw_vehicle_icon(self, surface, rect, scale_factor=1.0, color=(30, 30, 30)):
         """Draw a simple generic vehicle icon (wheels + body) into `rect`.
@@ -148,17 +289,9 @@ class MakersGun:
         try:
             # choose class and baseline world size
             if name == 'Bike':
-                try:
-                    from src.vehicles.bike import Bike
-                except Exception:
-                    Bike = None
                 VClass = Bike
                 world_size = 96.0
             elif name == 'Car':
-                try:
-                    from src.vehicles.car import Car
-                except Exception:
-                    Car = None
                 VClass = Car
                 world_size = 220.0
             else:
@@ -186,7 +319,7 @@ class MakersGun:
             scale = (target_px / float(world_size)) if world_size > 0 else 1.0
 
             # Save original scaling helpers
-            import src.scaling as _scaling
+            _scaling = scaling
             orig_to_screen_vec = getattr(_scaling, 'to_screen_vec', None)
             orig_to_screen_length = getattr(_scaling, 'to_screen_length', None)
             orig_to_screen = getattr(_scaling, 'to_screen', None)
@@ -275,14 +408,6 @@ class MakersGun:
             # prevent vehicles from overlapping and to produce a small bounce.
             try:
                 vehicles = []
-                try:
-                    from src.vehicles.bike import Bike
-                except Exception:
-                    Bike = None
-                try:
-                    from src.vehicles.car import Car
-                except Exception:
-                    Car = None
 
                 for b in self.bricks:
                     try:
@@ -306,16 +431,6 @@ class MakersGun:
                             for pb in parts_b:
                                 try:
                                     # determine radii heuristically
-                                    def _part_radius(obj, part):
-                                        try:
-                                            if hasattr(obj, 'front_wheel') and (part is getattr(obj, 'front_wheel', None) or part is getattr(obj, 'back_wheel', None)):
-                                                return float(getattr(obj, 'size', 40)) * 0.15
-                                            if hasattr(obj, 'seat') and part is getattr(obj, 'seat', None):
-                                                return float(getattr(obj, 'size', 40)) * 0.09
-                                            return float(getattr(obj, 'size', 40)) * 0.12
-                                        except Exception:
-                                            return 20.0
-
                                     ra = _part_radius(va, pa)
                                     rb = _part_radius(vb, pb)
 
@@ -371,58 +486,43 @@ class MakersGun:
             except Exception:
                 pass
 
-    def spawn_brick(self, world_pos):
-        b = Brick(world_pos, size=40)
-        self.bricks.append(b)
+    def _spawn_npc(self, world_pos, npcs):
+        """Add an NPC at world_pos to npcs and record it in the current world."""
+        wx, wy = _as_xy(world_pos)
+        npcs.append(NPC(wx, wy))
         try:
             mgr = get_world_manager()
             if mgr.current_name:
-                mgr.add_brick({"type": "brick", "x": float(world_pos[0]) if isinstance(world_pos, (list, tuple)) else float(world_pos.x), "y": float(world_pos[1]) if isinstance(world_pos, (list, tuple)) else float(world_pos.y), "size": 40})
-                mgr.save_now()
+                mgr.add_npc({'x': wx, 'y': wy})
         except Exception:
             pass
 
+    def spawn_brick(self, world_pos):
+        b = Brick(world_pos, size=40)
+        self.bricks.append(b)
+        _record_spawn("brick", world_pos, 40)
+
     def spawn_crate(self, world_pos):
         try:
             c = Crate(world_pos, size=48)
             self.bricks.append(c)
-            try:
-                mgr = get_world_manager()
-                if mgr.current_name:
-                    mgr.add_brick({"type": "crate", "x": float(world_pos[0]) if isinstance(world_pos, (list, tuple)) else float(world_pos.x), "y": float(world_pos[1]) if isinstance(world_pos, (list, tuple)) else float(world_pos.y), "size": 48})
-                    mgr.save_now()
-            except Exception:
-                pass
+            _record_spawn("crate", world_pos, 48)
         except Exception:
             pass
 
     def spawn_bike(self, world_pos):
         try:
-            from src.vehicles.bike import Bike
             b = Bike(world_pos, size=96)
             self.bricks.append(b)
-            try:
-                mgr = get_world_manager()
-                if mgr.current_name:
-                    mgr.add_brick({"type": "bike", "x": float(world_pos[0]) if isinstance(world_pos, (list, tuple)) else float(world_pos.x), "y": float(world_pos[1]) if isinstance(world_pos, (list, tuple)) else float(world_pos.y), "size": 96})
-                    mgr.save_now()
-            except Exception:
-                pass
+            _record_spawn("bike", world_pos, 96)
         except Exception:
             pass
 
     def spawn_car(self, world_pos):
         try:
-            from src.vehicles.car import Car
             c = Car(world_pos, size=220)
             self.bricks.append(c)
-            try:
-                mgr = get_world_manager()
-                if mgr.current_name:
-                    mgr.add_brick({"type": "car", "x": float(world_pos[0]) if isinstance(world_pos, (list, tuple)) else float(world_pos.x), "y": float(world_pos[1]) if isinstance(world_pos, (list, tuple)) else float(world_pos.y), "size": 220})
-                    mgr.save_now()
-            except Exception:
-                pass
+            _record_spawn("car", world_pos, 220)
         except Exception:
             pass
 
@@ -443,16 +543,9 @@ class MakersGun:
 
     def spawn_thruster(self, world_pos):
         try:
-            from src.thruster import Thruster
             t = Thruster(world_pos, icon=self.thruster_icon)
             self.bricks.append(t)
-            try:
-                mgr = get_world_manager()
-                if mgr.current_name:
-                    mgr.add_brick({"type": "thruster", "x": float(world_pos[0]) if isinstance(world_pos, (list, tuple)) else float(world_pos.x), "y": float(world_pos[1]) if isinstance(world_pos, (list, tuple)) else float(world_pos.y), "size": getattr(t, 'size', 32)})
-                    mgr.save_now()
-            except Exception:
-                pass
+            _record_spawn("thruster", world_pos, getattr(t, 'size', 32))
         except Exception:
             pass
 
@@ -530,8 +623,7 @@ class MakersGun:
         if self.ak47:
             try:
                 # Use the guns registry to lazily instantiate a gun object
-                from src.guns.core import create_gun
-                if not hasattr(self, '_ak47_obj') or self._ak47_obj is None:
+                if self._ak47_obj is None:
                     self._ak47_obj = create_gun('AK47', self.ak47['pos'], icon=self.ak47_icon)
                 if self._ak47_obj is not None:
                     self._ak47_obj.pos = self.ak47['pos']
@@ -570,27 +662,33 @@ class MakersGun:
 
     def find_nearest_moveable(self, world_pos, npcs, max_dist=80):
         best = None
-        best_d = max_dist
-        v = pygame.math.Vector2(world_pos)
+        # compare squared distances; nothing here needs the actual length
+        best_d2 = max_dist * max_dist
+        vx, vy = world_pos
 
         for b in self.bricks:
-            d = (b.p.pos - v).length()
-            if d < best_d:
-                best_d = d
+            bp = b.p.pos
+            dx = bp.x - vx
+            dy = bp.y - vy
+            d2 = dx * dx + dy * dy
+            if d2 < best_d2:
+                best_d2 = d2
                 best = ('brick', b)
 
-        if best_d > max_dist * 0.5:
+        if best_d2 > max_dist * max_dist * 0.25:
             for npc in npcs:
-                try:
-                    p = npc.particles[2].pos
-                except Exception:
-                    try:
-                        p = npc.particles[0].pos
-                    except Exception:
-                        continue
-                d = (p - v).length()
-                if d < best_d:
-                    best_d = d
+                particles = npc.particles
+                if len(particles) > 2:
+                    p = particles[2].pos
+                elif particles:
+                    p = particles[0].pos
+                else:
+                    continue
+                dx = p.x - vx
+                dy = p.y - vy
+                d2 = dx * dx + dy * dy
+                if d2 < best_d2:
+                    best_d2 = d2
                     best = ('npc', npc)
 
         return best
@@ -610,91 +708,36 @@ class MakersGun:
                         sw, sh = 800, 600
 
                     # Use same geometry as draw(): wider menu and internal tabs
-                    menu_w = max(340, int(sw * 0.7))
-                    menu_h = max(220, int(sh * 0.6))
-                    menu_w = min(menu_w, sw - 80)
-                    menu_h = min(menu_h, sh - 120)
-                    menu_x = (sw - menu_w) // 2
-                    menu_y = (sh - menu_h) // 2
+                    menu_rect, tab_rects, cell_names, cell_rects = self._menu_geom(sw, sh)
+                    # 1x1 rect at the click in menu-local coords, so the hit
+                    # tests below are single collidelist calls
+                    click = pygame.Rect(mx - menu_rect.x, my - menu_rect.y, 1, 1)
 
                     # Check tab clicks (tabs are inside menu at y = menu_y + 48)
-                    try:
-                        tabs = self.menu_tabs
-                        tab_count = max(1, len(tabs))
-                        tab_w = (menu_w - 40) // tab_count
-                        tabs_y = menu_y + 48
-                        for i in range(tab_count):
-                            tx = menu_x + 20 + i * tab_w
-                            tab_rect = pygame.Rect(tx, tabs_y, tab_w - 8, self.menu_tab_h)
-                            if tab_rect.collidepoint(mx, my):
-                                self.menu_tab_selected = i
-                                consumed = True
-                                return consumed
-                    except Exception:
-                        pass
+                    idx = click.collidelist(tab_rects)
+                    if idx != -1:
+                        self.menu_tab_selected = idx
+                        consumed = True
+                        return consumed
 
                     # Otherwise check grid cells (grid starts below tabs)
                     try:
-                        items = self.menu_tab_items.get(self.menu_tabs[self.menu_tab_selected], [])
-
-                        available_w = menu_w - 48
-                        cols = max(1, available_w // 120)
-                        cell_w = available_w // cols
-                        cell_size = max(48, min(140, cell_w))
-                        pad = 12
-                        start_x = menu_x + 24
-                        start_y = menu_y + 48 + self.menu_tab_h + 12
-
-                        for idx, name in enumerate(items):
-                            col = idx % cols
-                            row = idx // cols
-                            x = start_x + col * cell_size
-                            y = start_y + row * (cell_size + 18)
-                            r = pygame.Rect(x, y, cell_size - pad, cell_size - pad)
-                            if r.collidepoint(mx, my):
-                                # spawn immediately for some types
-                                if name in ('Wielding Tool', 'Pistol', 'Axe', 'NPC'):
-                                    try:
-                                        world_pos = scaling.to_world((mx, my))
-                                        if name == 'Wielding Tool':
-                                            self.spawn_welding_tool(world_pos)
-                                        elif name == 'Pistol':
-                                            self.spawn_pistol(world_pos, auto_equip=True)
-                                        elif name == 'Axe':
-                                            self.spawn_axe(world_pos, auto_equip=True)
-                                        else:
-                                            try:
-                                                wx, wy = world_pos
-                                                npcs.append(NPC(wx, wy))
-                                                try:
-                                                    mgr = get_world_manager()
-                                                    if mgr.current_name:
-                                                        mgr.add_npc({'x': float(wx), 'y': float(wy)})
-                                                        mgr.save_now()
-                                                except Exception:
-                                                    pass
-                                            except Exception:
-                                                try:
-                                                    nx, ny = world_pos.x, world_pos.y
-                                                    npcs.append(NPC(nx, ny))
-                                                    try:
-                                                        mgr = get_world_manager()
-                                                        if mgr.current_name:
-                                                            mgr.add_npc({'x': float(nx), 'y': float(ny)})
-                                                            mgr.save_now()
-                                                    except Exception:
-                                                        pass
-                                                except Exception:
-                                                    pass
-                                    except Exception:
-                                        pass
-
-                                    self.menu_selected = None
-                                else:
-                                    self.menu_selected = name
-                                self.close_menu()
-                                consumed = True
-                                return consumed
+                        idx = click.collidelist(cell_rects)
+                        if idx != -1:
+                            name = cell_names[idx]
+                            # spawn immediately for some types
+                            spawner = self._menu_click_spawners.get(name)
+                            if spawner is not None:
+                                try:
+                                    spawner(scaling.to_world((mx, my)), npcs)
+                                except Exception:
+                                    pass
+                                self.menu_selected = None
+                            else:
+                                self.menu_selected = name
+                            self.close_menu()
+                            consumed = True
+                            return consumed
                     except Exception:
                         pass
 
@@ -716,20 +759,16 @@ class MakersGun:
                 try:
                     if self.pistol and self.pistol.get('held', False):
                         self.pistol = None
-                        try:
-                            self._pistol_obj = None
-                        except Exception:
-                            pass
+                        self._release_tool('pistol', self._pistol_obj)
+                        self._pistol_obj = None
                         unequipped = True
                 except Exception:
                     pass
                 try:
                     if self.axe and self.axe.get('held', False):
                         self.axe = None
-                        try:
-                            self._axe_obj = None
-                        except Exception:
-                            pass
+                        self._release_tool('axe', self._axe_obj)
+                        self._axe_obj = None
                         unequipped = True
                 except Exception:
                     pass
@@ -758,28 +797,29 @@ class MakersGun:
                 except Exception:
                     world = pygame.math.Vector2(pygame.mouse.get_pos())
 
+                # squared distances throughout; only compared, never shown
                 best = None
-                best_d = 9999
+                best_d2 = 9999 * 9999
                 # check pistol
                 try:
                     if self.pistol:
-                        d = (self.pistol['pos'] - world).length()
-                        if d < best_d:
-                            best_d = d
-                            best = ('pistol', d)
+                        d2 = (self.pistol['pos'] - world).length_squared()
+                        if d2 < best_d2:
+                            best_d2 = d2
+                            best = ('pistol', d2)
                 except Exception:
                     pass
                 # check ak47
                 try:
                     if self.ak47:
-                        d = (self.ak47['pos'] - world).length()
-                        if d < best_d:
-                            best_d = d
-                            best = ('ak47', d)
+                        d2 = (self.ak47['pos'] - world).length_squared()
+                        if d2 < best_d2:
+                            best_d2 = d2
+                            best = ('ak47', d2)
                 except Exception:
                     pass
 
-                if best is not None and best[1] < 120:
+                if best is not None and best[1] < 120 * 120:
                     if best[0] == 'pistol':
                         try:
                             self.pistol['held'] = True
@@ -800,69 +840,16 @@ class MakersGun:
         if self.menu_selected is not None:
             if event.type == pygame.MOUSEBUTTONDOWN and event.button == 3:
                 pos = scaling.to_world(event.pos)
-                if self.menu_selected == 'Brick':
-                    self.spawn_brick(pos)
-                    consumed = True
-                    return consumed
-                elif self.menu_selected == 'Crate':
-                    self.spawn_crate(pos)
-                    consumed = True
-                    return consumed
-                elif self.menu_selected == 'Wielding Tool':
-                    self.spawn_welding_tool(pos)
-                    consumed = True
-                    return consumed
-                elif self.menu_selected == 'Pistol':
-                    self.spawn_pistol(pos)
-                    consumed = True
-                    return consumed
-                elif self.menu_selected == 'Axe':
-                    self.spawn_axe(pos)
-                    consumed = True
-                    return consumed
-                elif self.menu_selected == 'Thruster':
-                    self.spawn_thruster(pos)
-                    consumed = True
-                    return consumed
-                elif self.menu_selected == 'Bike':
-                    self.spawn_bike(pos)
-                    consumed = True
-                    return consumed
-                elif self.menu_selected == 'Car':
-                    self.spawn_car(pos)
-                    consumed = True
-                    return consumed
-                elif self.menu_selected == 'NPC':
-                    try:
-                        px, py = pos
-                        npcs.append(NPC(px, py))
-                        try:
-                            mgr = get_world_manager()
-                            if mgr.current_name:
-                                mgr.add_npc({"x": float(px), "y": float(py)})
-                                mgr.save_now()
-                        except Exception:
-                            pass
-                    except Exception:
-                        try:
-                            nx, ny = pos.x, pos.y
-                            npcs.append(NPC(nx, ny))
-                            try:
-                                mgr = get_world_manager()
-                                if mgr.current_name:
-                                    mgr.add_npc({"x": float(nx), "y": float(ny)})
-                                    mgr.save_now()
-                            except Exception:
-                                pass
-                        except Exception:
-                            pass
+                placer = self._place_spawners.get(self.menu_selected)
+                if placer is not None:
+                    placer(pos, npcs)
                     consumed = True
                     return consumed
 
             if self.menu_selected == 'Wielding Tool' and event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                 if self.welding_tool and not self.welding_tool['held']:
                     mouse_pos = pygame.math.Vector2(scaling.to_world(event.pos))
-                    if (mouse_pos - self.welding_tool['pos']).length() < 48:
+                    if (mouse_pos - self.welding_tool['pos']).length_squared() < 48 * 48:
                         self.pickup_welding_tool()
                         consumed = True
                         return consumed
@@ -870,7 +857,7 @@ class MakersGun:
                 if self.axe and not self.axe.get('held', False):
                     mouse_pos = pygame.math.Vector2(scaling.to_world(event.pos))
                     try:
-                        if (mouse_pos - self.axe['pos']).length() < 48:
+                        if (mouse_pos - self.axe['pos']).length_squared() < 48 * 48:
                             self.pickup_axe()
                             consumed = True
                             return consumed
@@ -881,8 +868,7 @@ class MakersGun:
 
             if event.button == 3 and self.ak47 and self.ak47.get('held', False):
                 try:
-                    from src.guns.core import create_gun
-                    if not hasattr(self, '_ak47_obj') or self._ak47_obj is None:
+                    if self._ak47_obj is None:
                         self._ak47_obj = create_gun('AK47', self.ak47['pos'], icon=self.ak47_icon)
                     if self._ak47_obj is not None:
                         self._ak47_obj.pos = self.ak47['pos']
@@ -896,9 +882,8 @@ class MakersGun:
 
             if event.button == 3 and self.pistol and self.pistol.get('held', False):
                 try:
-                    from src.guns.core import create_gun
-                    if not hasattr(self, '_pistol_obj') or self._pistol_obj is None:
-                        self._pistol_obj = create_gun('Pistol', self.pistol['pos'], icon=self.pistol_icon)
+                    if self._pistol_obj is None:
+                        self._pistol_obj = self._get_tool('pistol', self.pistol['pos'], self.pistol_icon)
                     if self._pistol_obj is not None:
                         self._pistol_obj.pos = self.pistol['pos']
                         self._pistol_obj.held = self.pistol['held']
@@ -932,7 +917,7 @@ class MakersGun:
 
                 if self.welding_tool and not self.welding_tool.get('held', False):
                     try:
-                        if (pos - self.welding_tool['pos']).length() < 48:
+                        if (pos - self.welding_tool['pos']).length_squared() < 48 * 48:
                             self.welding_tool['held'] = True
                             consumed = True
                             return consumed
@@ -941,7 +926,7 @@ class MakersGun:
 
                 if self.pistol and not self.pistol.get('held', False):
                     try:
-                        if (pos - self.pistol['pos']).length() < 96:
+                        if (pos - self.pistol['pos']).length_squared() < 96 * 96:
                             self.pistol['held'] = True
                             consumed = True
                             return consumed
@@ -951,7 +936,7 @@ class MakersGun:
                 if self.ak47 and not self.ak47.get('held', False):
                     try:
                         # slightly larger pickup radius for the AK47
-                        if (pos - self.ak47['pos']).length() < 140:
+                        if (pos - self.ak47['pos']).length_squared() < 140 * 140:
                             self.ak47['held'] = True
                             consumed = True
                             return consumed
@@ -960,7 +945,7 @@ class MakersGun:
 
                 if self.axe and not self.axe.get('held', False):
                     try:
-                        if (pos - self.axe['pos']).length() < 48:
+                        if (pos - self.axe['pos']).length_squared() < 48 * 48:
                             self.axe['held'] = True
                             consumed = True
                             return consumed
@@ -973,15 +958,10 @@ class MakersGun:
                     self.target = found
                     if found[0] == 'brick':
                         brick = found[1]
-                        try:
-                            root = brick.get_root()
-                        except Exception:
-                            root = brick
+                        # thrusters/vehicles share the list but never weld
+                        root = brick.get_root() if isinstance(brick, Brick) else brick
                         self.target = ('brick_group', (root, brick))
-                        try:
-                            self.offset = root.p.pos - brick.p.pos
-                        except Exception:
-                            self.offset = pygame.math.Vector2(0, 0)
+                        self.offset = root.p.pos - brick.p.pos
                         consumed = True
                     else:
                         npc = found[1]
@@ -1003,31 +983,22 @@ class MakersGun:
                 # dragging an NPC, try to auto-mount them into any nearby
                 # vehicle (bike or car) so dragging an NPC into a vehicle
                 # seats them and allows driving.
-                if self.target and self.target[0] == 'brick':
+                if self.target and self.target[0] in ('brick', 'brick_group'):
 
                     ttype = self.target[0]
                     if ttype == 'brick':
                         brick = self.target[1]
                         old_pos = brick.p.prev
                         brick.p.prev = brick.p.pos - (brick.p.pos - old_pos) * 0.5
-                    elif ttype == 'brick_group':
-                        try:
-                            root, selected = self.target[1]
-                        except Exception:
-                            root = self.target[1]
+                    else:
+                        root, selected = self.target[1]
                         old_prev = root.p.prev
                         old_vel = root.p.pos - old_prev
                         root.p.prev = root.p.pos - (old_vel * 0.5)
-                        try:
-                            damp_vel = root.p.pos - root.p.prev
-                            queue = [root]
-                            while queue:
-                                parent = queue.pop(0)
-                                for child in getattr(parent, 'welded_children', []):
-                                    child.p.prev = child.p.pos - damp_vel
-                                    queue.append(child)
-                        except Exception:
-                            pass
+                        damp_vel = root.p.pos - root.p.prev
+                        if isinstance(root, Brick):
+                            for child in root.get_descendants():
+                                child.p.prev = child.p.pos - damp_vel
                 elif self.target and self.target[0] == 'npc':
                     try:
                         npc = self.target[1]
@@ -1049,8 +1020,8 @@ class MakersGun:
                                         continue
                                     # distance threshold: ~30% of vehicle size
                                     thresh = getattr(b, 'size', 40) * 0.35
-                                    d = (b.seat.pos - ppos).length()
-                                    if d <= thresh:
+                                    d2 = (b.seat.pos - ppos).length_squared()
+                                    if d2 <= thresh * thresh:
                                         try:
                                             b.mount(npc)
                                             # mark consumed so we don't also nudge npc physics
@@ -1079,43 +1050,322 @@ class MakersGun:
 
         return consumed
 
-    def update(self, dt, npcs=None, floor=None):
-        # menu animation progress (advances even while menu_open/closed)
+    def _render_menu_bg(self, menu_w, menu_h, tab_rects, cell_rects):
+        """Render the static part of the spawn menu panel to a new Surface.
+
+        That is the rounded frame, header, tab pills and the empty item
+        cells; it only depends on the layout and the selected tab.
+        """
+        ui = pygame.Surface((menu_w, menu_h), pygame.SRCALPHA)
+        ui_rect = ui.get_rect()
+
+        # rounded background
+        bg_color = (28, 30, 34, 230)
+        border_color = (80, 88, 100)
+        pygame.draw.rect(ui, bg_color, ui_rect, border_radius=10)
+        pygame.draw.rect(ui, border_color, ui_rect, 2, border_radius=10)
+
+        # header
         try:
-            target = self.menu_anim_target
-            # simple lerp towards target controlled by speed
-            step = min(1.0, dt * self.menu_anim_speed)
-            self.menu_anim += (target - self.menu_anim) * step
-            # clamp
-            if self.menu_anim < 1e-4:
-                self.menu_anim = 0.0
-            if self.menu_anim > 1.0 - 1e-4:
-                self.menu_anim = 1.0
+            font = _font(max(18, scaling.to_screen_length(20)), 'Segoe UI')
+        except Exception:
+            font = _font(max(18, scaling.to_screen_length(20)), 'Arial')
+        header = _render_text(font, 'Select Item to Spawn', (235, 235, 235))
+        ui.blit(header, (24, 12))
+
+        # tabs (pill style)
+        try:
+            try:
+                tfont = _font(max(13, scaling.to_screen_length(14)), 'Segoe UI')
+            except Exception:
+                tfont = _font(max(12, scaling.to_screen_length(14)), 'Arial')
+            tabs_y = 48
+            # labels go on after all the pills, in one blits() call
+            tab_labels = []
+            for i, (tname, tab_rect) in enumerate(zip(self.menu_tabs, tab_rects)):
+                tx = tab_rect.x
+                if i == self.menu_tab_selected:
+                    # Selected tab: white background, black text per user request
+                    pygame.draw.rect(ui, (255, 255, 255), tab_rect, border_radius=8)
+                    pygame.draw.rect(ui, (220, 220, 220), tab_rect, 2, border_radius=8)
+                    txt_col = (20, 20, 20)
+                else:
+                    pygame.draw.rect(ui, (40, 44, 50), tab_rect, border_radius=8)
+                    pygame.draw.rect(ui, (70, 76, 86), tab_rect, 1, border_radius=8)
+                    txt_col = (200, 200, 200)
+                txt = _render_text(tfont, tname, txt_col)
+                tab_labels.append((txt, (tx + (tab_rect.w - txt.get_width()) // 2, tabs_y + (self.menu_tab_h - txt.get_height()) // 2)))
+            ui.blits(tab_labels, False)
         except Exception:
             pass
 
-        for b in self.bricks:
-            b.update(dt, floor_y=floor, other_bricks=self.bricks)
+        # empty item cells
+        cell_bg = (38, 42, 48)
+        cell_border = (70, 76, 86)
+        for r in cell_rects:
+            pygame.draw.rect(ui, cell_bg, r, border_radius=8)
+            pygame.draw.rect(ui, cell_border, r, 1, border_radius=8)
+        return ui
 
-        # Vehicle vs Vehicle collisions: always run when there are multiple
-        # vehicles in the world so cars/bikes don't pass through each other.
+    def _render_menu_ui(self, menu_w, menu_h, tab_rects, cell_names, cell_rects, hovered, lift):
+        """Render the spawn menu panel (header, tabs, item grid) to a new Surface.
+
+        `hovered` is the index of the cell under the mouse (-1 for none)
+        and `lift` how far that cell is raised. draw() caches the result
+        and only calls this when one of its inputs changes.
+        """
+        key = (menu_w, menu_h, self.menu_tab_selected, self.menu_tab_h, scaling.get_scale_version())
+        if key != self._menu_bg_key:
+            self._menu_bg = self._render_menu_bg(menu_w, menu_h, tab_rects, cell_rects)
+            self._menu_bg_key = key
+        ui = self._menu_bg.copy()
+
+        # items grid; icon previews and labels are queued and blitted in
+        # one blits() call each after the loop
+        icon_blits = []
+        label_blits = []
         try:
-            vehicles = []
             try:
-                from src.vehicles.bike import Bike
+                label_font = _font(max(13, scaling.to_screen_length(14)), 'Segoe UI')
+            except Exception:
+                label_font = _font(max(12, scaling.to_screen_length(14)), 'Arial')
+            for idx, (name, r) in enumerate(zip(cell_names, cell_rects)):
+                # the hovered cell is lifted by `lift` pixels
+                inner_rect = r.move(0, lift) if idx == hovered else r
+
+                # preview
+                preview_size = max(20, inner_rect.h - 16)
+                if preview_size != self._scaled_preview_size:
+                    self._scaled_icon_cache.clear()
+                    self._scaled_preview_size = preview_size
+                preview_rect = pygame.Rect(inner_rect.x + (inner_rect.w - preview_size) // 2, inner_rect.y + 8, preview_size, preview_size)
+                try:
+                    if name == 'Wielding Tool' and self.welding_icon is not None:
+                        icon_blits.append((self._get_scaled(self.welding_icon, preview_size), preview_rect))
+                    elif name == 'Pistol' and self.pistol_icon is not None:
+                        icon_blits.append((self._get_scaled(self.pistol_icon, preview_size), preview_rect))
+                    elif name == 'AK47' and self.ak47_icon is not None:
+                        icon_blits.append((self._get_scaled(self.ak47_icon, preview_size), preview_rect))
+                    elif name == 'Axe' and self.axe_icon is not None:
+                        icon_blits.append((self._get_scaled(self.axe_icon, preview_size), preview_rect))
+                    elif name == 'Thruster' and self.thruster_icon is not None:
+                        icon_blits.append((self._get_scaled(self.thruster_icon, preview_size), preview_rect))
+                    elif name in ('Car', 'Bike'):
+                        # Render an accurate vehicle preview using the vehicle's own draw()
+                        try:
+                            self._render_vehicle_preview(ui, preview_rect, name)
+                        except Exception:
+                            try:
+                                pygame.draw.rect(ui, (80, 80, 120), preview_rect)
+                            except Exception:
+                                pass
+                    elif name == 'NPC':
+                        # Draw the NPC head as the preview (outline, fill, eye)
+                        try:
+                            hs = max(8, preview_size)
+                            head = _npc_head_sprite(hs, max(2, scaling.to_screen_length(3)),
+                                                    max(1, scaling.to_screen_length(4)), 4)
+                            ui.blit(head, (preview_rect.centerx - hs // 2, preview_rect.centery - hs // 2))
+                        except Exception:
+                            # fallback to older simplistic icon if something goes wrong
+                            cx = preview_rect.centerx
+                            cy = preview_rect.centery
+                            head_r = max(3, int(preview_size * 0.18))
+                            torso_w = max(6, int(preview_size * 0.32))
+                            torso_h = max(8, int(preview_size * 0.38))
+                            head_center = (cx, cy - head_r)
+                            torso_rect = pygame.Rect(0, 0, torso_w, torso_h)
+                            torso_rect.center = (cx, cy + torso_h // 6)
+                            pygame.draw.circle(ui, (16, 40, 18), head_center, head_r)
+                            pygame.draw.circle(ui, (54, 160, 60), head_center, max(1, head_r - 2))
+                            pygame.draw.rect(ui, (16, 40, 18), torso_rect)
+                            inset = max(2, scaling.to_screen_length(1))
+                            inner = torso_rect.inflate(-inset, -inset)
+                            pygame.draw.rect(ui, (54, 160, 60), inner)
+                    elif name == 'Crate':
+                        try:
+                            draw_crate_pattern(ui, preview_rect, color=(160, 110, 60), outline=(60, 40, 20), border_radius=6)
+                        except Exception:
+                            pygame.draw.rect(ui, (160, 110, 60), preview_rect, border_radius=6)
+                    elif name == 'Bike':
+                        # basic bike preview: small frame + two wheels
+                        try:
+                            cx = preview_rect.centerx
+                            cy = preview_rect.centery
+                            wr = max(6, preview_size // 3)
+                            left = (cx - wr - 6, cy + 6)
+                            right = (cx + wr + 6, cy + 6)
+                            pygame.draw.circle(ui, (10, 10, 10), left, wr)
+                            pygame.draw.circle(ui, (10, 10, 10), right, wr)
+                            pygame.draw.line(ui, (30, 30, 30), (left[0] + wr, left[1] - 2), (cx, cy - 8), 2)
+                            pygame.draw.line(ui, (30, 30, 30), (cx, cy - 8), (right[0] - wr, right[1] - 2), 2)
+                            pygame.draw.rect(ui, (50, 50, 50), pygame.Rect(cx - 8, cy - 12, 16, 6))
+                        except Exception:
+                            pygame.draw.rect(ui, (80, 80, 120), preview_rect)
+                    else:
+                        # draw brick preview using shared pattern renderer
+                        try:
+                            draw_brick_pattern(ui, preview_rect, color=(150, 30, 30), outline=(30, 10, 10), border_radius=6)
+                        except Exception:
+                            # fallback simple rect
+                            pygame.draw.rect(ui, (150, 30, 30), preview_rect, border_radius=6)
+                            inset = max(4, scaling.to_screen_length(6))
+                            inner = preview_rect.inflate(-inset, -inset)
+                            pygame.draw.rect(ui, (200, 60, 60), inner, border_radius=4)
+
+                except Exception:
+                    pass
+
+                # label
+                lbl = _render_text(label_font, name, (220, 220, 220))
+                label_blits.append((lbl, (inner_rect.x + (inner_rect.w - lbl.get_width()) // 2, inner_rect.y + preview_size + 12)))
+
+            # hint: removed per UX request (do not show key hints like Q/Esc)
+        except Exception:
+            pass
+        ui.blits(icon_blits, False)
+        ui.blits(label_blits, False)
+        return ui
+
+    def _menu_geom(self, sw, sh):
+        """Return the spawn menu layout for a sw x sh screen.
+
+        Returns (menu_rect, tab_rects, cell_names, cell_rects) where the tab
+        and cell rects (for the selected tab's items) are relative to the menu's
+        top-left. Items whose cell would start below the panel are left out.
+        Cached until the screen size or selected tab changes, so draw() and
+        the click handler share one layout.
+        """
+        key = (sw, sh, self.menu_tab_selected, self.menu_tab_h)
+        cached = self._menu_geom_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        menu_w = max(340, int(sw * 0.7))
+        menu_h = max(220, int(sh * 0.6))
+        menu_w = min(menu_w, sw - 80)
+        menu_h = min(menu_h, sh - 120)
+        menu_rect = pygame.Rect((sw - menu_w) // 2, (sh - menu_h) // 2, menu_w, menu_h)
+
+        tab_count = max(1, len(self.menu_tabs))
+        tab_w = (menu_w - 40) // tab_count
+        tab_rects = [pygame.Rect(20 + i * tab_w, 48, tab_w - 8, self.menu_tab_h) for i in range(tab_count)]
+
+        items = self.menu_tab_items.get(self.menu_tabs[self.menu_tab_selected], ())
+        available_w = menu_w - 48
+        cols = max(1, available_w // 120)
+        cell_w = available_w // cols
+        cell_size = max(48, min(140, cell_w))
+        pad = 12
+        start_y = 48 + self.menu_tab_h + 12
+        cell_rects = []
+        for idx in range(len(items)):
+            x = 24 + (idx % cols) * cell_size
+            y = start_y + (idx // cols) * (cell_size + 18)
+            if y >= menu_h:
+                # cells fill row by row; this row and the rest are hidden
+                break
+            cell_rects.append(pygame.Rect(x, y, cell_size - pad, cell_size - pad))
+
+        geom = (menu_rect, tab_rects, items[:len(cell_rects)], cell_rects)
+        self._menu_geom_cache = (key, geom)
+        return geom
+
+    def _get_scaled(self, icon, size):
+        """Return icon smoothscaled to size x size, memoized per (icon, size)."""
+        key = (id(icon), size)
+        img = self._scaled_icon_cache.get(key)
+        if img is None:
+            try:
+                img = pygame.transform.smoothscale(icon, (size, size))
             except Exception:
-                Bike = None
+                # smoothscale only handles 24/32-bit surfaces
+                img = pygame.transform.scale(icon, (size, size))
             try:
-                from src.vehicles.car import Car
+                img = img.convert_alpha()
             except Exception:
-                Car = None
+                pass
+            self._scaled_icon_cache[key] = img
+        return img
+
+    def _get_tool(self, kind, pos, icon):
+        """Return a tool object of kind ('pistol', 'axe' or 'weld') at pos.
+
+        Reuses a released instance from _TOOL_POOL when one is available,
+        otherwise constructs a new one. Returns None when the tool's module
+        failed to import.
+        """
+        pool = self._TOOL_POOL[kind]
+        if pool:
+            tool = pool.pop()
+            tool.reset(pos, icon=icon)
+            return tool
+        if kind == 'pistol':
+            return create_gun('Pistol', pos, icon=icon) if create_gun is not None else None
+        if kind == 'axe':
+            return Axe(pos, icon=icon) if Axe is not None else None
+        return WeldingTool(pos, icon=icon) if WeldingTool is not None else None
+
+    def _release_tool(self, kind, tool):
+        """Hand a dropped tool object back to the pool for later reuse."""
+        if tool is not None and hasattr(tool, 'reset'):
+            self._TOOL_POOL[kind].append(tool)
+
+    def _run_over(self, npc, pos):
+        """Apply a vehicle hit to npc at pos (bleeding + small HP loss)."""
+        try:
+            npc.apply_bullet_hit((pos.x, pos.y))
+        except Exception:
+            # best-effort fallback: start bleeding and reduce HP
+            try:
+                npc.bleed_time = max(getattr(npc, 'bleed_time', 0.0), 2.5)
+                npc.last_hit_pos = pos.copy()
+                npc.hp -= 10.0
+            except Exception:
+                pass
+
+    def update(self, dt, npcs=None, floor=None, substep=None):
+        """Advance the gun, its tools and the world objects by dt.
+
+        The physics is stepped in equal substeps of roughly _fixed_dt;
+        `substep(sub_dt)`, when given, runs before each of them so velocity
+        writes (e.g. vehicle drive input) apply per substep.
+        """
+        # menu animation progress (advances even while menu_open/closed)
+        target = self.menu_anim_target
+        # simple lerp towards target controlled by speed
+        step = min(1.0, dt * self.menu_anim_speed)
+        self.menu_anim += (target - self.menu_anim) * step
+        # clamp; once closing and below one alpha step nothing is visible
+        if self.menu_anim < 1e-4 or (target == 0.0 and self.menu_anim < 1.0 / 255):
+            self.menu_anim = 0.0
+        if self.menu_anim > 1.0 - 1e-4:
+            self.menu_anim = 1.0
+
+        # spawns only mark the world dirty; write them out in one batch
+        try:
+            get_world_manager().flush(dt)
+        except Exception:
+            pass
+
+        # split the frame into equal substeps of about _fixed_dt; every
+        # frame steps at least once, so nothing stalls when the frame dt
+        # lands just under _fixed_dt (clock.tick gives whole milliseconds)
+        substeps = max(1, min(self._max_substeps, int(round(dt / self._fixed_dt))))
+        sub_dt = dt / substeps
+        for _ in range(substeps):
+            if substep is not None:
+                substep(sub_dt)
+            physics.step(self.bricks, sub_dt, floor)
+
+        # Vehicle vs Vehicle collisions: always run when there are multiple
+        # vehicles in the world so cars/bikes don't pass through each other.
+        try:
+            vehicles = []
 
             for b in self.bricks:
-                try:
-                    if (Bike is not None and isinstance(b, Bike)) or (Car is not None and isinstance(b, Car)):
-                        vehicles.append(b)
-                except Exception:
-                    continue
+                if (Bike is not None and isinstance(b, Bike)) or (Car is not None and isinstance(b, Car)):
+                    vehicles.append(b)
 
             for vi in range(len(vehicles)):
                 for vj in range(vi + 1, len(vehicles)):
@@ -1130,16 +1380,6 @@ class MakersGun:
                     for pa in parts_a:
                         for pb in parts_b:
                             try:
-                                def _part_radius(obj, part):
-                                    try:
-                                        if hasattr(obj, 'front_wheel') and (part is getattr(obj, 'front_wheel', None) or part is getattr(obj, 'back_wheel', None)):
-                                            return float(getattr(obj, 'size', 40)) * 0.15
-                                        if hasattr(obj, 'seat') and part is getattr(obj, 'seat', None):
-                                            return float(getattr(obj, 'size', 40)) * 0.09
-                                        return float(getattr(obj, 'size', 40)) * 0.12
-                                    except Exception:
-                                        return 20.0
-
                                 ra = _part_radius(va, pa)
                                 rb = _part_radius(vb, pb)
 
@@ -1215,8 +1455,14 @@ class MakersGun:
 
         if npcs and self.bricks:
             try:
+                # bricks have moved during the substeps; hash their final spots
+                index = physics.build_index(self.bricks)
+                # particles of different NPCs don't interact here, so resolve
+                # them all in one call instead of one call per NPC
+                particles = []
                 for npc in npcs:
-                    colison.collide_particles_with_bricks(npc.particles, self.bricks, iterations=2)
+                    particles.extend(npc.particles)
+                colison.collide_particles_with_bricks(particles, self.bricks, iterations=2, spatial_index=index)
             except Exception:
                 pass
 
@@ -1225,14 +1471,6 @@ class MakersGun:
             # vehicle part overlaps an NPC particle we trigger the NPC hit logic which
             # starts bleeding and applies a small immediate HP loss.
             try:
-                try:
-                    from src.vehicles.bike import Bike
-                except Exception:
-                    Bike = None
-                try:
-                    from src.vehicles.car import Car
-                except Exception:
-                    Car = None
 
                 for b in list(self.bricks):
                     try:
@@ -1244,22 +1482,16 @@ class MakersGun:
 
                     parts = getattr(b, 'parts', []) or []
                     for part in parts:
-                        # choose an effective collision radius per part (defensive)
-                        try:
-                            if hasattr(b, 'front_wheel') and (part is getattr(b, 'front_wheel', None) or part is getattr(b, 'back_wheel', None)):
-                                vr = float(getattr(b, 'size', 40)) * 0.15
-                            elif hasattr(b, 'seat') and part is getattr(b, 'seat', None):
-                                vr = float(getattr(b, 'size', 40)) * 0.09
-                            else:
-                                vr = float(getattr(b, 'size', 40)) * 0.12
-                        except Exception:
-                            vr = 20.0
+                        # choose an effective collision radius per part
+                        if part is getattr(b, 'front_wheel', None) or part is getattr(b, 'back_wheel', None):
+                            vr = float(getattr(b, 'size', 40)) * 0.15
+                        elif part is getattr(b, 'seat', None):
+                            vr = float(getattr(b, 'size', 40)) * 0.09
+                        else:
+                            vr = float(getattr(b, 'size', 40)) * 0.12
 
                         # part velocity magnitude (px/frame approx -> px/s scaled by dt is not available here)
-                        try:
-                            vvel = (part.pos - part.prev).length()
-                        except Exception:
-                            vvel = 0.0
+                        vvel = (part.pos - part.prev).length()
 
                         # helpful thresholds (lowered so slow cars still count)
                         min_part_speed = 30.0
@@ -1267,78 +1499,36 @@ class MakersGun:
 
                         for npc in list(npcs):
                             # Particle-level collision checks
-                            try:
-                                for npart in npc.particles:
-                                    try:
-                                        # infer npc particle radius (use NPC.size as fallback)
-                                        nr = getattr(npart, 'size', None)
-                                        if nr is None:
-                                            nr = getattr(npc, 'size', 14)
-                                        # many codepaths store 'size' as full diameter
-                                        try:
-                                            nr = float(nr) * 0.5
-                                        except Exception:
-                                            nr = 8.0
-                                    except Exception:
-                                        nr = 8.0
-
-                                    # distance test
-                                    try:
-                                        d = (part.pos - npart.pos).length()
-                                    except Exception:
-                                        continue
-
-                                    if d <= (vr + nr):
-                                        # require some minimum speed to count as a run-over
-                                        if vvel > min_part_speed or abs(getattr(b, 'drive_vel', 0.0)) > min_drive_speed:
-                                            try:
-                                                # apply the NPC hit effect at the contact point
-                                                npc.apply_bullet_hit((part.pos.x, part.pos.y))
-                                            except Exception:
-                                                # best-effort fallback: start bleeding and reduce HP
-                                                try:
-                                                    npc.bleed_time = max(getattr(npc, 'bleed_time', 0.0), 2.5)
-                                                    npc.last_hit_pos = part.pos.copy()
-                                                    npc.hp -= 10.0
-                                                except Exception:
-                                                    pass
-                                            # avoid multiple hits from the same part in a single update
-                                            break
-                            except Exception:
-                                # continue to next npc if particle iteration fails
-                                continue
+                            for npart in npc.particles:
+                                # infer npc particle radius (use NPC.size as fallback);
+                                # many codepaths store 'size' as full diameter
+                                nr = getattr(npart, 'size', None)
+                                if nr is None:
+                                    nr = getattr(npc, 'size', 14)
+                                nr = float(nr) * 0.5
+
+                                if (part.pos - npart.pos).length_squared() <= (vr + nr) * (vr + nr):
+                                    # require some minimum speed to count as a run-over
+                                    if vvel > min_part_speed or abs(getattr(b, 'drive_vel', 0.0)) > min_drive_speed:
+                                        self._run_over(npc, part.pos)
+                                        # avoid multiple hits from the same part in a single update
+                                        break
 
                             # Additional coarse check: if vehicle root is overlapping NPC torso
                             # this helps detect run-overs when parts don't align with particles.
-                            try:
-                                try:
-                                    torso = npc.particles[2].pos
-                                except Exception:
-                                    torso = npc.particles[0].pos
-                                root_dist = (getattr(b, 'p', b).pos - torso).length()
-                                if root_dist <= max(1.0, float(getattr(b, 'size', 40)) * 0.4):
-                                    if abs(getattr(b, 'drive_vel', 0.0)) > min_drive_speed:
-                                        try:
-                                            npc.apply_bullet_hit((torso.x, torso.y))
-                                        except Exception:
-                                            try:
-                                                npc.bleed_time = max(getattr(npc, 'bleed_time', 0.0), 2.5)
-                                                npc.last_hit_pos = torso.copy()
-                                                npc.hp -= 10.0
-                                            except Exception:
-                                                pass
-                            except Exception:
-                                pass
+                            parts_n = npc.particles
+                            if not parts_n:
+                                continue
+                            torso = parts_n[2].pos if len(parts_n) > 2 else parts_n[0].pos
+                            root_r = max(1.0, float(getattr(b, 'size', 40)) * 0.4)
+                            if (getattr(b, 'p', b).pos - torso).length_squared() <= root_r * root_r:
+                                if abs(getattr(b, 'drive_vel', 0.0)) > min_drive_speed:
+                                    self._run_over(npc, torso)
                             
             except Exception:
                 pass
 
             # Attach NPCs to vehicles when they reach the seat
-            try:
-                from src.vehicles.bike import Bike
-            except Exception:
-                Bike = None
-
             if Bike is not None:
                 try:
                     for b in self.bricks:
@@ -1401,113 +1591,93 @@ class MakersGun:
                 except Exception:
                     pass
 
-        if self.welding_tool:
-            from src.wield import WeldingTool
-            if not hasattr(self, '_welding_tool_obj') or self._welding_tool_obj is None:
-                self._welding_tool_obj = WeldingTool(self.welding_tool['pos'], icon=self.welding_icon)
-            self._welding_tool_obj.pos = self.welding_tool['pos']
-            self._welding_tool_obj.held = self.welding_tool['held']
-            self._welding_tool_obj.update(npcs or [], self.bricks)
-
-            if self.welding_tool['held']:
-                try:
-                    self.welding_tool['pos'] = pygame.math.Vector2(scaling.to_world(pygame.mouse.get_pos()))
-                except Exception:
-                    self.welding_tool['pos'] = pygame.math.Vector2(pygame.mouse.get_pos())
+        # world-space mouse position; held tools and dragging follow it
+        mouse_world = scaling.to_world(pygame.mouse.get_pos())
 
+        if self.welding_tool:
             try:
-                if hasattr(self, '_welding_tool_obj') and self._welding_tool_obj is not None:
-                    for b in list(self.bricks):
-                        try:
-                            if hasattr(b, 'apply_thrust'):
-                                b.apply_thrust(dt, welding_tool=self._welding_tool_obj, npcs=npcs, bricks=self.bricks)
-                        except Exception:
-                            pass
+                if self._welding_tool_obj is None:
+                    self._welding_tool_obj = self._get_tool('weld', self.welding_tool['pos'], self.welding_icon)
+                tool = self._welding_tool_obj
+                tool.pos = self.welding_tool['pos']
+                tool.held = self.welding_tool['held']
+                tool.update(npcs or [], self.bricks)
+
+                if self.welding_tool['held']:
+                    self.welding_tool['pos'] = pygame.math.Vector2(mouse_world)
             except Exception:
                 pass
 
+            # thrusters get their own guard so a welding tool error doesn't
+            # switch them all off for the frame
+            tool = self._welding_tool_obj
+            if tool is not None:
+                try:
+                    for b in list(self.bricks):
+                        if hasattr(b, 'apply_thrust'):
+                            b.apply_thrust(dt, welding_tool=tool, npcs=npcs, bricks=self.bricks)
+                except Exception:
+                    pass
+
         if self.pistol:
             try:
-                from src.guns.core import create_gun
-                if not hasattr(self, '_pistol_obj') or self._pistol_obj is None:
-                    self._pistol_obj = create_gun('Pistol', self.pistol['pos'], icon=self.pistol_icon)
+                if self._pistol_obj is None:
+                    self._pistol_obj = self._get_tool('pistol', self.pistol['pos'], self.pistol_icon)
                 if self._pistol_obj is not None:
                     self._pistol_obj.pos = self.pistol['pos']
                     self._pistol_obj.held = self.pistol['held']
-                    try:
-                        self._pistol_obj.update(dt, npcs or [], floor)
-                    except Exception:
-                        try:
-                            self._pistol_obj.update(dt)
-                        except Exception:
-                            pass
+                    self._pistol_obj.update(dt, npcs or [], floor)
 
                 if self.pistol.get('held', False):
-                    try:
-                        self.pistol['pos'] = pygame.math.Vector2(scaling.to_world(pygame.mouse.get_pos()))
-                    except Exception:
-                        self.pistol['pos'] = pygame.math.Vector2(pygame.mouse.get_pos())
+                    self.pistol['pos'] = pygame.math.Vector2(mouse_world)
             except Exception:
                 pass
 
         if self.axe:
             try:
-                from src.axe import Axe
-                if not hasattr(self, '_axe_obj') or self._axe_obj is None:
-                    self._axe_obj = Axe(self.axe['pos'], icon=self.axe_icon)
+                if self._axe_obj is None:
+                    self._axe_obj = self._get_tool('axe', self.axe['pos'], self.axe_icon)
                 self._axe_obj.pos = self.axe['pos']
                 self._axe_obj.held = self.axe['held']
-                try:
-                    self._axe_obj.update(npcs or [], self.bricks, floor)
-                except Exception:
-                    try:
-                        self._axe_obj.update(npcs or [], self.bricks, floor)
-                    except Exception:
-                        pass
+                self._axe_obj.update(npcs or [], self.bricks, floor)
 
                 if self.axe['held']:
-                    try:
-                        self.axe['pos'] = pygame.math.Vector2(scaling.to_world(pygame.mouse.get_pos()))
-                    except Exception:
-                        self.axe['pos'] = pygame.math.Vector2(pygame.mouse.get_pos())
+                    self.axe['pos'] = pygame.math.Vector2(mouse_world)
             except Exception:
                 pass
 
         if self.dragging and self.target is not None:
-            mpos = pygame.math.Vector2(scaling.to_world(pygame.mouse.get_pos()))
-            desired = mpos + self.offset
+            # Vector2 + tuple yields a fresh Vector2; no intermediate copy
+            desired = self.offset + mouse_world
             ttype, obj = self.target
 
             if ttype == 'brick':
-
-                old_pos = obj.p.pos.copy()
-                old_vel = obj.p.pos - obj.p.prev
-                obj.p.pos = desired
-
-                obj.p.prev = obj.p.pos - (old_vel * 0.2)
+                # keep a fifth of the old velocity; write pos/prev in place
+                p = obj.p
+                vx = (p.pos.x - p.prev.x) * 0.2
+                vy = (p.pos.y - p.prev.y) * 0.2
+                p.pos.update(desired)
+                p.prev.update(desired.x - vx, desired.y - vy)
             elif ttype == 'brick_group':
-                try:
-                    root, selected = obj
-                except Exception:
-                    root = obj
-                    selected = obj
-
-                old_pos = root.p.pos.copy()
-                old_vel = root.p.pos - root.p.prev
-                root.p.pos = desired
-                root.p.prev = root.p.pos - (old_vel * 0.2)
-
-                try:
-                    root_vel = root.p.pos - root.p.prev
-                    queue = [root]
-                    while queue:
-                        parent = queue.pop(0)
-                        for child in getattr(parent, 'welded_children', []):
-                            child.p.pos = parent.p.pos + child.welded_offset
-                            child.p.prev = child.p.pos - root_vel
-                            queue.append(child)
-                except Exception:
-                    pass
+                root, selected = obj
+
+                rp = root.p
+                vx = (rp.pos.x - rp.prev.x) * 0.2
+                vy = (rp.pos.y - rp.prev.y) * 0.2
+                rp.pos.update(desired)
+                rp.prev.update(desired.x - vx, desired.y - vy)
+
+                # children follow at their weld offsets with the root's
+                # velocity; descendants come parents-first so each parent
+                # is already placed when its children read it
+                if isinstance(root, Brick):
+                    for child in root.get_descendants():
+                        ppos = child.welded_to.p.pos
+                        off = child.welded_offset
+                        cx = ppos.x + off.x
+                        cy = ppos.y + off.y
+                        child.p.pos.update(cx, cy)
+                        child.p.prev.update(cx - vx, cy - vy)
             else:
                 try:
                     idx = 2
@@ -1520,25 +1690,43 @@ class MakersGun:
                     p.pos += delta
 
     def draw(self, surf):
-
+        # visible area in world coords; bricks entirely outside it are skipped.
+        # vehicles/thrusters draw beyond their size (flames, wheels) so they
+        # are always drawn.
+        sw, sh = surf.get_size()
+        x0, y0 = scaling.to_world((0, 0))
+        x1, y1 = scaling.to_world((sw, sh))
+        # runs of plain bricks are submitted with one blits() call; the
+        # batch is flushed before anything else draws so layering is kept
+        batch = []
         for b in self.bricks:
+            if isinstance(b, Brick):
+                px = b.p.pos.x
+                py = b.p.pos.y
+                m = b.size
+                if px + m < x0 or px - m > x1 or py + m < y0 or py - m > y1:
+                    continue
+                if type(b) is Brick:
+                    batch.append(b.blit_args())
+                    continue
+            if batch:
+                surf.blits(batch, False)
+                batch = []
             b.draw(surf)
+        if batch:
+            surf.blits(batch, False)
 
         if self.welding_tool:
-            if not hasattr(self, '_welding_tool_obj') or self._welding_tool_obj is None:
-                from src.wield import WeldingTool
-                self._welding_tool_obj = WeldingTool(self.welding_tool['pos'], icon=self.welding_icon)
-            self._welding_tool_obj.pos = self.welding_tool['pos']
-            self._welding_tool_obj.held = self.welding_tool['held']
-            self._welding_tool_obj.draw(surf)
+            if self._welding_tool_obj is None:
+                self._welding_tool_obj = self._get_tool('weld', self.welding_tool['pos'], self.welding_icon)
+            if self._welding_tool_obj is not None:
+                self._welding_tool_obj.pos = self.welding_tool['pos']
+                self._welding_tool_obj.held = self.welding_tool['held']
+                self._welding_tool_obj.draw(surf)
 
         if self.pistol:
-            if not hasattr(self, '_pistol_obj') or self._pistol_obj is None:
-                try:
-                    from src.guns.core import create_gun
-                    self._pistol_obj = create_gun('Pistol', self.pistol['pos'], icon=self.pistol_icon)
-                except Exception:
-                    self._pistol_obj = None
+            if self._pistol_obj is None:
+                self._pistol_obj = self._get_tool('pistol', self.pistol['pos'], self.pistol_icon)
             if self._pistol_obj is not None:
                 self._pistol_obj.pos = self.pistol['pos']
                 self._pistol_obj.held = self.pistol['held']
@@ -1548,12 +1736,8 @@ class MakersGun:
                     pass
 
         if self.ak47:
-            if not hasattr(self, '_ak47_obj') or self._ak47_obj is None:
-                try:
-                    from src.guns.core import create_gun
-                    self._ak47_obj = create_gun('AK47', self.ak47['pos'], icon=self.ak47_icon)
-                except Exception:
-                    self._ak47_obj = None
+            if self._ak47_obj is None and create_gun is not None:
+                self._ak47_obj = create_gun('AK47', self.ak47['pos'], icon=self.ak47_icon)
             if self._ak47_obj is not None:
                 self._ak47_obj.pos = self.ak47['pos']
                 self._ak47_obj.held = self.ak47['held']
@@ -1563,12 +1747,8 @@ class MakersGun:
                     pass
 
         if self.axe:
-            if not hasattr(self, '_axe_obj') or self._axe_obj is None:
-                try:
-                    from src.axe import Axe
-                    self._axe_obj = Axe(self.axe['pos'], icon=self.axe_icon)
-                except Exception:
-                    self._axe_obj = None
+            if self._axe_obj is None:
+                self._axe_obj = self._get_tool('axe', self.axe['pos'], self.axe_icon)
             if self._axe_obj is not None:
                 self._axe_obj.pos = self.axe['pos']
                 self._axe_obj.held = self.axe['held']
@@ -1578,222 +1758,40 @@ class MakersGun:
 
         # Render menu when open or animating
         if self.menu_open or self.menu_anim > 0.0:
-            try:
-                sw, sh = surf.get_size()
-            except Exception:
-                sw, sh = 800, 600
-
-            menu_w = max(340, int(sw * 0.7))
-            menu_h = max(220, int(sh * 0.6))
-            menu_w = min(menu_w, sw - 80)
-            menu_h = min(menu_h, sh - 120)
-            menu_x = (sw - menu_w) // 2
-            menu_y = (sh - menu_h) // 2
-
-            # dim background with 50% black at full open, scaled by menu_anim
-            try:
-                overlay = pygame.Surface((sw, sh), pygame.SRCALPHA)
-                overlay_alpha = int(128 * self.menu_anim)
-                overlay.fill((0, 0, 0, overlay_alpha))
-                surf.blit(overlay, (0, 0))
-            except Exception:
-                pass
-
-            # draw UI onto its own surface so we can apply fade/scale easily
-            try:
-                ui = pygame.Surface((menu_w, menu_h), pygame.SRCALPHA)
-                ui_rect = ui.get_rect()
-
-                # rounded background
-                bg_color = (28, 30, 34, 230)
-                border_color = (80, 88, 100)
-                pygame.draw.rect(ui, bg_color, ui_rect, border_radius=10)
-                pygame.draw.rect(ui, border_color, ui_rect, 2, border_radius=10)
-
-                # header
-                try:
-                    font = pygame.font.SysFont('Segoe UI', max(18, scaling.to_screen_length(20)))
-                except Exception:
-                    font = pygame.font.SysFont('Arial', max(18, scaling.to_screen_length(20)))
-                header = font.render('Select Item to Spawn', True, (235, 235, 235))
-                ui.blit(header, (24, 12))
-
-                # tabs (pill style)
-                try:
-                    tabs = self.menu_tabs
-                    tab_count = max(1, len(tabs))
-                    tab_w = (menu_w - 40) // tab_count
-                    tabs_y = 48
-                    for i, tname in enumerate(tabs):
-                        tx = 20 + i * tab_w
-                        tab_rect = pygame.Rect(tx, tabs_y, tab_w - 8, self.menu_tab_h)
-                        if i == self.menu_tab_selected:
-                            # Selected tab: white background, black text per user request
-                            pygame.draw.rect(ui, (255, 255, 255), tab_rect, border_radius=8)
-                            pygame.draw.rect(ui, (220, 220, 220), tab_rect, 2, border_radius=8)
-                            txt_col = (20, 20, 20)
-                        else:
-                            pygame.draw.rect(ui, (40, 44, 50), tab_rect, border_radius=8)
-                            pygame.draw.rect(ui, (70, 76, 86), tab_rect, 1, border_radius=8)
-                            txt_col = (200, 200, 200)
-                        try:
-                            tfont = pygame.font.SysFont('Segoe UI', max(13, scaling.to_screen_length(14)))
-                        except Exception:
-                            tfont = pygame.font.SysFont('Arial', max(12, scaling.to_screen_length(14)))
-                        txt = tfont.render(tname, True, txt_col)
-                        ui.blit(txt, (tx + (tab_rect.w - txt.get_width()) // 2, tabs_y + (self.menu_tab_h - txt.get_height()) // 2))
-                except Exception:
-                    pass
-
-                # items grid
-                try:
-                    items = self.menu_tab_items.get(self.menu_tabs[self.menu_tab_selected], [])
-                    available_w = menu_w - 48
-                    cols = max(1, available_w // 120)
-                    cell_w = available_w // cols
-                    cell_size = max(48, min(140, cell_w))
-                    pad = 12
-                    start_x = 24
-                    start_y = 48 + self.menu_tab_h + 12
-
-                    mx, my = m
-                    rel_mx = mx - menu_x
-                    rel_my = my - menu_y
-
-                    for idx, name in enumerate(items):
-                        col = idx % cols
-                        row = idx // cols
-                        x = start_x + col * cell_size
-                        y = start_y + row * (cell_size + 18)
-                        r = pygame.Rect(x, y, cell_size - pad, cell_size - pad)
-
-                        # base cell
-                        cell_bg = (38, 42, 48)
-                        cell_border = (70, 76, 86)
-                        pygame.draw.rect(ui, cell_bg, r, border_radius=8)
-                        pygame.draw.rect(ui, cell_border, r, 1, border_radius=8)
-
-                        # hover detection using relative mouse coords
-                        hovered = r.collidepoint(rel_mx, rel_my)
-                        lift = -6 if hovered else 0
-                        lift = int(lift * self.menu_anim)
-                        inner_rect = r.move(0, lift)
-
-                        # preview
-                        preview_size = max(20, inner_rect.h - 16)
-                        preview_rect = pygame.Rect(inner_rect.x + (inner_rect.w - preview_size) // 2, inner_rect.y + 8, preview_size, preview_size)
-                        try:
-                            if name == 'Wielding Tool' and self.welding_icon is not None:
-                                ui.blit(pygame.transform.scale(self.welding_icon, (preview_size, preview_size)), preview_rect)
-                            elif name == 'Pistol' and self.pistol_icon is not None:
-                                ui.blit(pygame.transform.scale(self.pistol_icon, (preview_size, preview_size)), preview_rect)
-                            elif name == 'AK47' and self.ak47_icon is not None:
-                                ui.blit(pygame.transform.scale(self.ak47_icon, (preview_size, preview_size)), preview_rect)
-                            elif name == 'Axe' and self.axe_icon is not None:
-                                ui.blit(pygame.transform.scale(self.axe_icon, (preview_size, preview_size)), preview_rect)
-                            elif name == 'Thruster' and self.thruster_icon is not None:
-                                ui.blit(pygame.transform.scale(self.thruster_icon, (preview_size, preview_size)), preview_rect)
-                            elif name in ('Car', 'Bike'):
-                                # Render an accurate vehicle preview using the vehicle's own draw()
-                                try:
-                                    self._render_vehicle_preview(ui, preview_rect, name)
-                                except Exception:
-                                    try:
-                                        pygame.draw.rect(ui, (80, 80, 120), preview_rect)
-                                    except Exception:
-                                        pass
-                            elif name == 'NPC':
-                                # Draw the NPC head as the preview (outline, fill, eye)
-                                try:
-                                    cx = preview_rect.centerx
-                                    cy = preview_rect.centery
-                                    hs = max(8, preview_size)
-                                    head_rect = pygame.Rect(0, 0, hs, hs)
-                                    head_rect.center = (cx, cy)
-                                    outline_col = (16, 40, 18)
-                                    fill_col = (54, 160, 60)
-                                    pygame.draw.rect(ui, outline_col, head_rect, border_radius=4)
-                                    inner = head_rect.inflate(-max(2, scaling.to_screen_length(3)), -max(2, scaling.to_screen_length(3)))
-                                    pygame.draw.rect(ui, fill_col, inner, border_radius=3)
-                                    # simple eye (left)
-                                    eye_w = max(1, scaling.to_screen_length(4))
-                                    eye_x = int(cx - hs * 0.16)
-                                    eye_y = int(cy - hs * 0.12)
-                                    pygame.draw.rect(ui, (10, 10, 10), pygame.Rect(eye_x, eye_y, eye_w, eye_w))
-                                except Exception:
-                                    # fallback to older simplistic icon if something goes wrong
-                                    cx = preview_rect.centerx
-                                    cy = preview_rect.centery
-                                    head_r = max(3, int(preview_size * 0.18))
-                                    torso_w = max(6, int(preview_size * 0.32))
-                                    torso_h = max(8, int(preview_size * 0.38))
-                                    head_center = (cx, cy - head_r)
-                                    torso_rect = pygame.Rect(0, 0, torso_w, torso_h)
-                                    torso_rect.center = (cx, cy + torso_h // 6)
-                                    pygame.draw.circle(ui, (16, 40, 18), head_center, head_r)
-                                    pygame.draw.circle(ui, (54, 160, 60), head_center, max(1, head_r - 2))
-                                    pygame.draw.rect(ui, (16, 40, 18), torso_rect)
-                                    inner = torso_rect.inflate(-max(2, scaling.to_screen_length(1)), -max(2, scaling.to_screen_length(1)))
-                                    pygame.draw.rect(ui, (54, 160, 60), inner)
-                            elif name == 'Crate':
-                                try:
-                                    draw_crate_pattern(ui, preview_rect, color=(160, 110, 60), outline=(60, 40, 20), border_radius=6)
-                                except Exception:
-                                    pygame.draw.rect(ui, (160, 110, 60), preview_rect, border_radius=6)
-                            elif name == 'Bike':
-                                # basic bike preview: small frame + two wheels
-                                try:
-                                    cx = preview_rect.centerx
-                                    cy = preview_rect.centery
-                                    wr = max(6, preview_size // 3)
-                                    left = (cx - wr - 6, cy + 6)
-                                    right = (cx + wr + 6, cy + 6)
-                                    pygame.draw.circle(ui, (10, 10, 10), left, wr)
-                                    pygame.draw.circle(ui, (10, 10, 10), right, wr)
-                                    pygame.draw.line(ui, (30, 30, 30), (left[0] + wr, left[1] - 2), (cx, cy - 8), 2)
-                                    pygame.draw.line(ui, (30, 30, 30), (cx, cy - 8), (right[0] - wr, right[1] - 2), 2)
-                                    pygame.draw.rect(ui, (50, 50, 50), pygame.Rect(cx - 8, cy - 12, 16, 6))
-                                except Exception:
-                                    pygame.draw.rect(ui, (80, 80, 120), preview_rect)
-                            else:
-                                # draw brick preview using shared pattern renderer
-                                try:
-                                    draw_brick_pattern(ui, preview_rect, color=(150, 30, 30), outline=(30, 10, 10), border_radius=6)
-                                except Exception:
-                                    # fallback simple rect
-                                    pygame.draw.rect(ui, (150, 30, 30), preview_rect, border_radius=6)
-                                    inner = preview_rect.inflate(-max(4, scaling.to_screen_length(6)), -max(4, scaling.to_screen_length(6)))
-                                    pygame.draw.rect(ui, (200, 60, 60), inner, border_radius=4)
-                            
-                        except Exception:
-                            pass
-
-                        # label
-                        try:
-                            label_font = pygame.font.SysFont('Segoe UI', max(13, scaling.to_screen_length(14)))
-                        except Exception:
-                            label_font = pygame.font.SysFont('Arial', max(12, scaling.to_screen_length(14)))
-                        lbl = label_font.render(name, True, (220, 220, 220))
-                        ui.blit(lbl, (inner_rect.x + (inner_rect.w - lbl.get_width()) // 2, inner_rect.y + preview_size + 12))
-
-                    # hint: removed per UX request (do not show key hints like Q/Esc)
-                except Exception:
-                    pass
-
-                # apply overall UI alpha based on menu_anim and blit
-                try:
-                    ui.set_alpha(int(255 * self.menu_anim))
-                    surf.blit(ui, (menu_x, menu_y))
-                except Exception:
-                    surf.blit(ui, (menu_x, menu_y))
-            except Exception:
-                pass
+            sw, sh = surf.get_size()
+
+            menu_rect, tab_rects, cell_names, cell_rects = self._menu_geom(sw, sh)
+            menu_x, menu_y, menu_w, menu_h = menu_rect
+
+            # dim background to 50% at full open, scaled by menu_anim; done
+            # in place by multiplying RGB rather than blending an overlay
+            dim = int(128 * self.menu_anim)
+            if dim > 0:
+                keep = 255 - dim
+                surf.fill((keep, keep, keep), special_flags=pygame.BLEND_RGB_MULT)
+
+            # draw UI onto its own surface so we can apply fade/scale easily;
+            # the panel is only re-rendered when its contents would change
+            ui_alpha = int(255 * self.menu_anim)
+            if ui_alpha <= 0:
+                return
+            mx, my = m
+            hovered = pygame.Rect(mx - menu_x, my - menu_y, 1, 1).collidelist(cell_rects)
+            lift = int(-6 * self.menu_anim) if hovered != -1 else 0
+            key = (sw, sh, self.menu_tab_selected, hovered, lift, scaling.get_scale_version(),
+                   tuple(self._preview_vehicle_colors.items()))
+            if key != self._menu_ui_key:
+                self._menu_ui = self._render_menu_ui(menu_w, menu_h, tab_rects, cell_names, cell_rects, hovered, lift)
+                self._menu_ui_key = key
+            ui = self._menu_ui
+
+            # apply overall UI alpha based on menu_anim and blit
+            ui.set_alpha(ui_alpha)
+            surf.blit(ui, (menu_x, menu_y))
 
             return
 
         if not self.equipped:
-            for b in self.bricks:
-                b.draw(surf)
             return
 
         if self.icon is not None:
@@ -1811,8 +1809,8 @@ class MakersGun:
         pygame.draw.rect(surf, (20, 10, 10), icon_rect, 1)
 
         try:
-            font = pygame.font.SysFont('Arial', max(10, scaling.to_screen_length(12)))
-            txt = font.render('Brick', True, (220, 220, 220))
+            font = _font(max(10, scaling.to_screen_length(12)), 'Arial')
+            txt = _render_text(font, 'Brick', (220, 220, 220))
             surf.blit(txt, (icon_rect.right + 8, menu_rect.y + 8))
         except Exception:
             pass
@@ -1823,7 +1821,7 @@ class MakersGun:
                 pr = pygame.Rect(m[0] + 16, m[1] - self.menu_h // 2 - ps - 8, ps, ps)
                 if self.menu_selected == 'Pistol' and self.pistol_icon is not None:
                     try:
-                        img = pygame.transform.scale(self.pistol_icon, (ps, ps))
+                        img = self._get_scaled(self.pistol_icon, ps)
                         surf.blit(img, (pr.x, pr.y))
                     except Exception:
                         pygame.draw.rect(surf, (30, 10, 10), pr)
@@ -1831,7 +1829,7 @@ class MakersGun:
                         pygame.draw.rect(surf, (180, 30, 30), inner)
                 elif self.menu_selected == 'AK47' and self.ak47_icon is not None:
                     try:
-                        img = pygame.transform.scale(self.ak47_icon, (ps, ps))
+                        img = self._get_scaled(self.ak47_icon, ps)
                         surf.blit(img, (pr.x, pr.y))
                     except Exception:
                         pygame.draw.rect(surf, (30, 10, 10), pr)
@@ -1839,7 +1837,7 @@ class MakersGun:
                         pygame.draw.rect(surf, (180, 30, 30), inner)
                 elif self.menu_selected == 'Axe' and self.axe_icon is not None:
                     try:
-                        img = pygame.transform.scale(self.axe_icon, (ps, ps))
+                        img = self._get_scaled(self.axe_icon, ps)
                         surf.blit(img, (pr.x, pr.y))
                     except Exception:
                         pygame.draw.rect(surf, (30, 10, 10), pr)
@@ -1847,20 +1845,10 @@ class MakersGun:
                         pygame.draw.rect(surf, (180, 30, 30), inner)
                 elif self.menu_selected == 'NPC':
                     try:
-                        cx = pr.centerx
-                        cy = pr.centery
                         hs = max(6, ps)
-                        head_rect = pygame.Rect(0, 0, hs, hs)
-                        head_rect.center = (cx, cy)
-                        outline_col = (16, 40, 18)
-                        fill_col = (54, 160, 60)
-                        pygame.draw.rect(surf, outline_col, head_rect, border_radius=3)
-                        inner = head_rect.inflate(-max(1, scaling.to_screen_length(2)), -max(1, scaling.to_screen_length(2)))
-                        pygame.draw.rect(surf, fill_col, inner, border_radius=2)
-                        eye_w = max(1, scaling.to_screen_length(3))
-                        eye_x = int(cx - hs * 0.16)
-                        eye_y = int(cy - hs * 0.12)
-                        pygame.draw.rect(surf, (10, 10, 10), pygame.Rect(eye_x, eye_y, eye_w, eye_w))
+                        head = _npc_head_sprite(hs, max(1, scaling.to_screen_length(2)),
+                                                max(1, scaling.to_screen_length(3)), 3)
+                        surf.blit(head, (pr.centerx - hs // 2, pr.centery - hs // 2))
                     except Exception:
                         pygame.draw.rect(surf, (30, 10, 10), pr)
                         inner = pr.inflate(-2, -2)
@@ -1873,7 +1861,7 @@ class MakersGun:
                         pygame.draw.rect(surf, (80, 80, 120), pr)
                 elif self.menu_selected == 'Thruster' and self.thruster_icon is not None:
                     try:
-                        img = pygame.transform.scale(self.thruster_icon, (ps, ps))
+                        img = self._get_scaled(self.thruster_icon, ps)
                         surf.blit(img, (pr.x, pr.y))
                     except Exception:
                         pygame.draw.rect(surf, (30, 10, 10), pr)
@@ -1,3 +1,4 @@
+from functools import lru_cache
 import pygame
 from src import scaling
 from src.npc import Particle
@@ -19,22 +20,82 @@ class Crate(Brick):
 
     def draw(self, surf):
         # similar to Brick.draw but use crate visual
-        center = scaling.to_screen_vec(self.p.pos)
-        s = scaling.to_screen_length(self.size)
-        rect = pygame.Rect(0, 0, int(s), int(s))
-        rect.center = (int(center.x), int(center.y))
-
-        # draw crate pattern into rect
         try:
-            draw_crate_pattern(surf, rect, color=self.color, outline=self.outline, border_radius=6)
+            surf.blit(*self.blit_args())
         except Exception:
             try:
+                center = scaling.to_screen_vec(self.p.pos)
+                s = scaling.to_screen_length(self.size)
+                rect = pygame.Rect(0, 0, int(s), int(s))
+                rect.center = (int(center.x), int(center.y))
                 pygame.draw.rect(surf, self.outline, rect)
-                inner = rect.inflate(-max(2, int(scaling.to_screen_length(3))), -max(2, int(scaling.to_screen_length(3))))
-                pygame.draw.rect(surf, self.color, inner)
+                inset = max(2, int(scaling.to_screen_length(3)))
+                pygame.draw.rect(surf, self.color, rect.inflate(-inset, -inset))
             except Exception:
                 pass
 
+    def blit_args(self):
+        """Return (sprite, dest) for drawing this crate; see Brick.blit_args."""
+        center = scaling.to_screen_vec(self.p.pos)
+        key = (scaling.get_scale_version(), self.size, self.color, self.outline)
+        if key != self._sprite_key:
+            s = int(scaling.to_screen_length(self.size))
+            px3 = int(scaling.to_screen_length(3))
+            rivet_r = max(1, int(scaling.to_screen_length(1)))
+            self._sprite = _crate_sprite(s, s, tuple(self.color), tuple(self.outline), 6, px3, rivet_r)
+            self._sprite_key = key
+            self._sprite_px = s
+        h = self._sprite_px // 2
+        return self._sprite, (int(center.x) - h, int(center.y) - h)
+
+
+@lru_cache(maxsize=32)
+def _crate_sprite(width, height, color, outline, border_radius, px3, rivet_r):
+    """Render the crate pattern once into a width x height Surface."""
+    sprite = pygame.Surface((width, height), pygame.SRCALPHA)
+    rect = sprite.get_rect()
+
+    # Outline
+    pygame.draw.rect(sprite, outline, rect, border_radius=border_radius)
+
+    # inner wood area
+    inset = max(2, px3)
+    inner = rect.inflate(-inset, -inset)
+    pygame.draw.rect(sprite, color, inner, border_radius=max(0, border_radius - 1))
+
+    # slat color (slightly darker than base)
+    slat_color = (max(0, color[0] - 20), max(0, color[1] - 20), max(0, color[2] - 20))
+    slat_thickness = max(1, px3)
+
+    # draw 3 horizontal slats evenly spaced
+    ph = max(2, inner.height)
+    slat_count = 3
+    for i in range(1, slat_count + 1):
+        y = inner.top + int(round(i * (ph / (slat_count + 1))))
+        pygame.draw.rect(sprite, slat_color, pygame.Rect(inner.left, y - slat_thickness // 2, inner.width, slat_thickness))
+
+    # draw two vertical metal bands (slightly darker / grey)
+    band_color = (50, 50, 50)
+    band_w = max(2, px3)
+    # left band and right band positions
+    left_x = inner.left + int(inner.width * 0.18)
+    right_x = inner.left + int(inner.width * 0.82)
+    pygame.draw.rect(sprite, band_color, pygame.Rect(left_x - band_w // 2, inner.top, band_w, inner.height))
+    pygame.draw.rect(sprite, band_color, pygame.Rect(right_x - band_w // 2, inner.top, band_w, inner.height))
+
+    # small metal rivets along bands (dots)
+    rivet_color = (200, 200, 200)
+    for bx in (left_x, right_x):
+        for j in range(3):
+            ry = inner.top + int((j + 1) * (ph / 4))
+            pygame.draw.circle(sprite, rivet_color, (bx, ry), rivet_r)
+    try:
+        sprite = sprite.convert_alpha()
+    except Exception:
+        # no display mode set yet; the unconverted surface still blits
+        pass
+    return sprite
+
 
 def draw_crate_pattern(surf, rect, color=None, outline=None, border_radius=4):
     """Draw a wooden crate pattern into rect.
@@ -48,41 +109,11 @@ def draw_crate_pattern(surf, rect, color=None, outline=None, border_radius=4):
         if outline is None:
             outline = (60, 40, 20)
 
-        # Outline
-        pygame.draw.rect(surf, outline, rect, border_radius=border_radius)
-
-        # inner wood area
-        inner = rect.inflate(-max(2, int(scaling.to_screen_length(3))), -max(2, int(scaling.to_screen_length(3))))
-        pygame.draw.rect(surf, color, inner, border_radius=max(0, border_radius - 1))
-
-        # slat color (slightly darker than base)
-        slat_color = (max(0, color[0] - 20), max(0, color[1] - 20), max(0, color[2] - 20))
-        slat_thickness = max(1, int(scaling.to_screen_length(3)))
-
-        # draw 3 horizontal slats evenly spaced
-        pw = max(2, inner.width)
-        ph = max(2, inner.height)
-        slat_count = 3
-        for i in range(1, slat_count + 1):
-            y = inner.top + int(round(i * (ph / (slat_count + 1))))
-            pygame.draw.rect(surf, slat_color, pygame.Rect(inner.left, y - slat_thickness // 2, inner.width, slat_thickness))
-
-        # draw two vertical metal bands (slightly darker / grey)
-        band_color = (50, 50, 50)
-        band_w = max(2, int(scaling.to_screen_length(3)))
-        # left band and right band positions
-        left_x = inner.left + int(inner.width * 0.18)
-        right_x = inner.left + int(inner.width * 0.82)
-        pygame.draw.rect(surf, band_color, pygame.Rect(left_x - band_w // 2, inner.top, band_w, inner.height))
-        pygame.draw.rect(surf, band_color, pygame.Rect(right_x - band_w // 2, inner.top, band_w, inner.height))
-
-        # small metal rivets along bands (d ots)
-        rivet_color = (200, 200, 200)
+        # 3 world px on screen; shared by the inset, slats and bands
+        px3 = int(scaling.to_screen_length(3))
         rivet_r = max(1, int(scaling.to_screen_length(1)))
-        for bx in (left_x, right_x):
-            for j in range(3):
-                ry = inner.top + int((j + 1) * (ph / 4))
-                pygame.draw.circle(surf, rivet_color, (bx, ry), rivet_r)
+        sprite = _crate_sprite(rect.width, rect.height, tuple(color), tuple(outline), border_radius, px3, rivet_r)
+        surf.blit(sprite, rect)
     except Exception:
         try:
             # fallback to simple rect
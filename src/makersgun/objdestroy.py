@@ -1,5 +1,5 @@
 import random
-import pygame
+from math import cos, pi, sin
 from src import scaling
 
 """Utilities for breaking/destroying maker-gun objects into fragments.
@@ -31,80 +31,60 @@ def break_into_fragments(obj, rows=2, cols=2, spread=0.8, impulse=220):
 
     # Defensive: ensure we have the basic attributes
     try:
-        pos = obj.p.pos
-        prev = obj.p.prev
+        px, py = obj.p.pos
+        qx, qy = obj.p.prev
         size = float(getattr(obj, 'size', 12))
         mass = float(getattr(obj.p, 'mass', 1.0))
     except Exception:
         return fragments
 
-    parent_vel = pos - prev
+    # parent's velocity, kept as floats; pieces get 45% of it
+    pvx = (px - qx) * 0.45
+    pvy = (py - qy) * 0.45
     total_pieces = max(1, rows * cols)
 
     # Determine fragment size (keep minimum to avoid 0-size)
     frag_size = max(6, int(size / max(rows, cols)))
+    step = frag_size * spread
+    piece_mass = max(0.01, mass / total_pieces)
+    lo = 0.4 * impulse
+    hi = 1.1 * impulse
+    damp = max(1.0, frag_size / 12.0)
 
     cls = obj.__class__
     base_color = getattr(obj, 'color', None)
 
     for r in range(rows):
+        # center offsets so pieces tile over original area
+        sy = py + (r - (rows - 1) / 2.0) * step
         for c in range(cols):
-            # center offsets so pieces tile over original area
-            cx = (c - (cols - 1) / 2.0) * (frag_size * spread)
-            cy = (r - (rows - 1) / 2.0) * (frag_size * spread)
+            sx = px + (c - (cols - 1) / 2.0) * step
 
+            # instantiate a new piece using the same class where possible;
+            # its particle copies (sx, sy) into pos and prev
             try:
-                spawn_pos = pygame.math.Vector2(pos.x + cx, pos.y + cy)
-            except Exception:
-                try:
-                    spawn_pos = pygame.math.Vector2(pos[0] + cx, pos[1] + cy)
-                except Exception:
-                    spawn_pos = pygame.math.Vector2(0, 0)
-
-            # instantiate a new piece using the same class where possible
-            try:
-                piece = cls(spawn_pos, size=frag_size, mass=max(0.01, mass / total_pieces), color=base_color)
+                piece = cls((sx, sy), size=frag_size, mass=piece_mass, color=base_color)
             except Exception:
                 # fallback: try importing Brick-like signature with fewer args
                 try:
-                    piece = cls(spawn_pos, size=frag_size)
+                    piece = cls((sx, sy), size=frag_size)
                 except Exception:
                     continue
 
             # give an initial velocity by setting prev position appropriately
-            angle = random.uniform(0, 2 * 3.14159)
-            mag = random.uniform(0.4 * impulse, 1.1 * impulse) / max(1.0, frag_size / 12.0)
-            kick = pygame.math.Vector2(mag * math_cos(angle), mag * math_sin(angle))
-
-            # add some upward bias so fragments pop upward on break
-            kick.y = kick.y - abs(mag) * 0.35
-
-            # combine parent's velocity (small contribution) with random kick
-            init_vel = parent_vel * 0.45 + kick
+            angle = random.uniform(0, 2 * pi)
+            mag = random.uniform(lo, hi) / damp
+            # random kick with some upward bias so fragments pop upward on
+            # break, combined with a small share of the parent's velocity
+            vx = pvx + mag * cos(angle)
+            vy = pvy + mag * sin(angle) - abs(mag) * 0.35
 
             try:
-                piece.p.pos = spawn_pos
-                piece.p.prev = piece.p.pos - init_vel
+                piece.p.pos.update(sx, sy)
+                piece.p.prev.update(sx - vx, sy - vy)
             except Exception:
                 pass
 
             fragments.append(piece)
 
     return fragments
-
-
-# lightweight local helpers to avoid importing math full module repeatedly
-def math_cos(a):
-    try:
-        from math import cos
-        return cos(a)
-    except Exception:
-        return 0.0
-
-
-def math_sin(a):
-    try:
-        from math import sin
-        return sin(a)
-    except Exception:
-        return 0.0
@@ -0,0 +1,59 @@
+"""World-level physics step for the objects owned by MakersGun.
+
+MakersGun.bricks mixes bricks/crates with thrusters and vehicles. step()
+hashes all of them into one SpatialHash per call and advances each object
+by dt; bricks use the hash as their collision broadphase, everything else
+keeps its own update(). Welded bricks are moved last, by their roots.
+"""
+import pygame
+from .brick import Brick, _MAX_WELD_DEPTH
+from .spatial_hash import SpatialHash
+
+
+def build_index(bricks):
+    """Hash the current AABBs of `bricks` into a SpatialHash (None if empty)."""
+    if not bricks:
+        return None
+    # size cells off the bricks; vehicles just span several cells
+    max_size = 0
+    for b in bricks:
+        if isinstance(b, Brick) and b.size > max_size:
+            max_size = b.size
+    index = SpatialHash(cell=(max_size or 40) * 1.5)
+    for b in bricks:
+        s = b.size
+        index.insert(b, pygame.Rect(int(b.p.pos.x - s / 2), int(b.p.pos.y - s / 2), int(s), int(s)))
+    return index
+
+
+def _weld_depth(b):
+    """Number of weld links between `b` and its root."""
+    depth = 0
+    cur = b.welded_to
+    while cur is not None and depth < _MAX_WELD_DEPTH:
+        depth += 1
+        cur = getattr(cur, 'welded_to', None)
+    return depth
+
+
+def step(bricks, dt, floor=None):
+    """Advance every object in `bricks` by one fixed step of dt.
+
+    Only free objects are integrated and collided; welded bricks are held
+    back and snapped to their parents afterwards, parents before children,
+    so a group follows its root's position from this same step.
+    """
+    index = build_index(bricks)
+    welded = []
+    for b in bricks:
+        if isinstance(b, Brick):
+            if b.welded_to is not None:
+                welded.append(b)
+                continue
+            b.update(dt, floor_y=floor, other_bricks=bricks, spatial_index=index)
+        else:
+            b.update(dt, floor_y=floor, other_bricks=bricks)
+    if welded:
+        welded.sort(key=_weld_depth)
+        for b in welded:
+            b.update(dt, floor_y=floor, other_bricks=bricks, spatial_index=index)
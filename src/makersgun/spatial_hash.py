@@ -0,0 +1,60 @@
+class SpatialHash:
+    """Uniform grid over (obj, pygame.Rect) pairs for broad-phase lookups.
+
+    Bricks are near-uniform squares, so a flat grid with cells a bit
+    larger than a brick keeps inserts and queries close to O(1). Objects
+    larger than a cell (vehicles) are registered in every cell they cover.
+    """
+
+    def __init__(self, cell=60):
+        self.cell = max(1, int(cell))
+        self.cells = {}
+
+    def _range(self, rect):
+        c = self.cell
+        return (rect.left // c, rect.top // c,
+                (rect.right - 1) // c, (rect.bottom - 1) // c)
+
+    def insert(self, obj, rect):
+        cells = self.cells
+        x0, y0, x1, y1 = self._range(rect)
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                key = (cx, cy)
+                bucket = cells.get(key)
+                if bucket is None:
+                    cells[key] = [obj]
+                else:
+                    bucket.append(obj)
+
+    def query(self, rect):
+        """Return objects registered in any cell `rect` touches.
+
+        This is a candidate list (no exact overlap test); order follows
+        insertion so results are deterministic.
+        """
+        cells = self.cells
+        found = {}
+        x0, y0, x1, y1 = self._range(rect)
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    for obj in bucket:
+                        found[obj] = None
+        return list(found)
+
+    def query_point(self, x, y):
+        """Return objects in the cell containing (x, y) and its 8 neighbours."""
+        c = self.cell
+        cx = int(x // c)
+        cy = int(y // c)
+        cells = self.cells
+        found = {}
+        for ix in (cx - 1, cx, cx + 1):
+            for iy in (cy - 1, cy, cy + 1):
+                bucket = cells.get((ix, iy))
+                if bucket:
+                    for obj in bucket:
+                        found[obj] = None
+        return list(found)
@@ -62,6 +62,9 @@ class Menu:
         self._font = pygame.font.SysFont(self.font_name, self.font_size)
         # Button font (smaller so labels fit buttons)
         self._button_font = pygame.font.SysFont(self.font_name, max(12, int(self.font_size * 0.7)))
+        # (font id, text, color) -> rendered Surface for the static labels;
+        # cleared whenever the option list changes
+        self._text_cache = {}
 
         # Precompute layout in design coords (we compute vertical start dynamically
         # during drawing so the menu is vertically centered regardless of number
@@ -75,6 +78,17 @@ class Menu:
         # Small cached surface for design rendering (re-used each draw)
         self._design_surf = pygame.Surface((int(self.design_w), int(self.design_h)), pygame.SRCALPHA)
 
+        # Full-window background (base, center rect, grid, floor) once the
+        # zoom has settled, and the layout it was rendered for
+        self._bg_surf = None
+        self._bg_key = None
+        # Smoothscaled design surface for settled frames and the (size, UI
+        # state) it was scaled for
+        self._scaled_ui = None
+        self._scaled_key = None
+        # Full-window darkening tint, re-created only when the window resizes
+        self._tint = None
+
     def handle_event(self, event) -> bool:
         """Return True if event consumed by menu."""
         if not self.active:
@@ -117,21 +131,14 @@ class Menu:
                 return True
 
         elif event.type == pygame.MOUSEMOTION:
-            mx, my = scaling.to_world(event.pos)
             # If in create mode, we don't change selection by hover over options
             if self.menu_mode == 'create':
                 return True
+            mx, my = scaling.to_world(event.pos)
             # check option hit in design coords (main/worlds list)
-            ox = int(self._slide_x)
-            # center vertically based on number of options
-            center_y = self.design_h * 0.5
-            start_y = int(center_y - ((len(self.options) - 1) * self._option_spacing) / 2)
-            for i, _ in enumerate(self.options):
-                ty = start_y + i * self._option_spacing
-                text_rect = pygame.Rect(ox, ty - self.font_size // 2, self.design_w - ox, self.font_size)
-                if text_rect.collidepoint(mx, my):
-                    self.selected = i
-                    break
+            i = self._option_at(mx, my)
+            if i != -1:
+                self.selected = i
             return True
 
         elif event.type == pygame.MOUSEBUTTONDOWN:
@@ -178,20 +185,32 @@ class Menu:
                         return True
 
                 # Otherwise we are in a list (main or worlds)
-                ox = int(self._slide_x)
-                center_y = self.design_h * 0.5
-                start_y = int(center_y - ((len(self.options) - 1) * self._option_spacing) / 2)
-                for i, _ in enumerate(self.options):
-                    ty = start_y + i * self._option_spacing
-                    text_rect = pygame.Rect(ox, ty - self.font_size // 2, self.design_w - ox, self.font_size)
-                    if text_rect.collidepoint(mx, my):
-                        self.selected = i
-                        self._activate_selected()
-                        return True
+                i = self._option_at(mx, my)
+                if i != -1:
+                    self.selected = i
+                    self._activate_selected()
                 return True
 
         return False
 
+    def _option_at(self, mx, my):
+        """Return the index of the option row under design point (mx, my), or -1.
+
+        Rows are font_size tall, _option_spacing apart and vertically
+        centered, and reach from the slide offset to the right edge; the
+        row is found arithmetically rather than by testing each one.
+        """
+        ox = int(self._slide_x)
+        if not (ox <= mx < self.design_w):
+            return -1
+        # center vertically based on number of options
+        start_y = int(self.design_h * 0.5 - ((len(self.options) - 1) * self._option_spacing) / 2)
+        top = start_y - self.font_size // 2
+        i = int((my - top) // self._option_spacing)
+        if 0 <= i < len(self.options) and my - top - i * self._option_spacing < self.font_size:
+            return i
+        return -1
+
     def _activate_selected(self):
         choice = self.options[self.selected]
         # Behavior depends on current menu mode
@@ -253,12 +272,14 @@ class Menu:
         self.options = list(self.world_options)
         self.menu_mode = 'worlds'
         self.selected = 0
+        self._text_cache.clear()
         self.underline_progress = [0.0 for _ in self.options]
 
     def _enter_main(self):
         self.options = list(self.main_options)
         self.menu_mode = 'main'
         self.selected = 0
+        self._text_cache.clear()
         self.underline_progress = [0.0 for _ in self.options]
 
     def _enter_create(self):
@@ -267,6 +288,7 @@ class Menu:
         self.options = ["Create A World"]
         self.selected = 0
         self.create_input = ''
+        self._text_cache.clear()
         self.underline_progress = [0.0 for _ in self.options]
         self._update_create_scroll()
 
@@ -301,6 +323,45 @@ class Menu:
         text_w = self._font.size(self.create_input)[0]
         self._create_scroll_x = max(0, text_w - available)
 
+    def _render(self, font, text, color):
+        """Return font.render(text, True, color), memoized in _text_cache."""
+        key = (id(font), text, color)
+        rendered = self._text_cache.get(key)
+        if rendered is None:
+            rendered = font.render(text, True, color)
+            self._text_cache[key] = rendered
+        return rendered
+
+    def _draw_background(self, bg, aw, ah, bg_ox, bg_oy, center_rect, grid_px, top_y):
+        """Draw the full-window background (grid + floor) onto bg."""
+        # Fill background base color
+        bg.fill((10, 18, 12))
+
+        # Slightly different center rect
+        pygame.draw.rect(bg, (6, 10, 8), center_rect)
+
+        # Grid drawn across the visible screen using scaled spacing
+        grid_color = (38, 180, 85)
+
+        # vertical lines: start from bg_ox and expand both directions to cover the screen
+        x = bg_ox
+        while x > 0:
+            x -= grid_px
+        while x <= aw:
+            pygame.draw.line(bg, grid_color, (int(x), 0), (int(x), ah), 1)
+            x += grid_px
+
+        # horizontal lines
+        y = bg_oy
+        while y > 0:
+            y -= grid_px
+        while y <= ah:
+            pygame.draw.line(bg, grid_color, (0, int(y)), (aw, int(y)), 1)
+            y += grid_px
+
+        # floor that spans full width and reaches bottom of screen
+        pygame.draw.rect(bg, (80, 80, 90), pygame.Rect(0, top_y, aw, max(0, ah - top_y)))
+
     def draw(self, surf):
         """Draw the menu to the provided actual-screen surface."""
         # Design surface (UI-only): keep transparent background and draw
@@ -322,43 +383,37 @@ class Menu:
         bg_ox = (aw - sw) // 2
         bg_oy = (ah - sh) // 2
 
-        # Fill background base color
-        surf.fill((10, 18, 12))
-
         # Slightly different center rect mapped to screen coords
-        center_rect = pygame.Rect(
+        center_rect = (
             int(round(self.design_w * 0.05 * combined + bg_ox)),
             int(round(self.design_h * 0.1 * combined + bg_oy)),
             int(round(self.design_w * 0.9 * combined)),
             int(round(self.design_h * 0.7 * combined)),
         )
-        pygame.draw.rect(surf, (6, 10, 8), center_rect)
-
-        # Grid drawn across the visible screen using scaled spacing
-        grid_color = (38, 180, 85)
-        g = 40
-        grid_px = max(1, int(round(g * combined)))
-
-        # vertical lines: start from bg_ox and expand both directions to cover the screen
-        x = bg_ox
-        while x > 0:
-            x -= grid_px
-        while x <= aw:
-            pygame.draw.line(surf, grid_color, (int(x), 0), (int(x), ah), 1)
-            x += grid_px
-
-        # horizontal lines
-        y = bg_oy
-        while y > 0:
-            y -= grid_px
-        while y <= ah:
-            pygame.draw.line(surf, grid_color, (0, int(y)), (aw, int(y)), 1)
-            y += grid_px
-
-        # floor that spans full width and reaches bottom of screen; top mapped from design coords
+        # Grid spacing scaled to the screen
+        grid_px = max(1, int(round(40 * combined)))
+        # floor top mapped from design coords
         floor_y = int(self.design_h * 0.75)
         top_y = int(round(floor_y * combined + bg_oy))
-        pygame.draw.rect(surf, (80, 80, 90), pygame.Rect(0, top_y, aw, max(0, ah - top_y)))
+
+        if abs(self.zoom - self.zoom_target) > 2e-3:
+            # the layout moves by whole pixels most frames while zooming;
+            # draw straight to the window rather than into a cache
+            self._draw_background(surf, aw, ah, bg_ox, bg_oy, center_rect, grid_px, top_y)
+        else:
+            # settled: render once and reuse until the window is resized
+            bg_key = (aw, ah, bg_ox, bg_oy, center_rect, grid_px, top_y)
+            if bg_key != self._bg_key:
+                bg = pygame.Surface((aw, ah))
+                try:
+                    bg = bg.convert()
+                except Exception:
+                    # no display mode set; the unconverted surface still blits
+                    pass
+                self._draw_background(bg, aw, ah, bg_ox, bg_oy, center_rect, grid_px, top_y)
+                self._bg_surf = bg
+                self._bg_key = bg_key
+            surf.blit(self._bg_surf, (0, 0))
 
         # Draw options or create UI on design surface with slide offset applied
         ox = int(self._slide_x)
@@ -384,11 +439,12 @@ class Menu:
 
             # Render input text — blit onto input_surf with scroll so the end is visible
             if self.create_input:
+                # typed text changes per keystroke; not worth caching
                 txt = font.render(self.create_input, True, (230, 230, 230))
                 input_surf.blit(txt, (8 - int(self._create_scroll_x), (ih - txt.get_height()) // 2))
             else:
                 placeholder = "Enter world name..."
-                txt = font.render(placeholder, True, (160, 160, 160))
+                txt = self._render(font, placeholder, (160, 160, 160))
                 input_surf.blit(txt, (8, (ih - txt.get_height()) // 2))
 
             # Blit the clipped input surface onto the design surface
@@ -399,8 +455,8 @@ class Menu:
             # Create button
             # Create and Cancel buttons — use smaller button font and size buttons to fit text
             button_font = self._button_font
-            create_txt = button_font.render("Create", True, (255, 255, 255))
-            cancel_txt = button_font.render("Cancel", True, (255, 255, 255))
+            create_txt = self._render(button_font, "Create", (255, 255, 255))
+            cancel_txt = self._render(button_font, "Cancel", (255, 255, 255))
 
             btn_w = max(140, create_txt.get_width() + 24)
             btn_h = ih
@@ -416,24 +472,35 @@ class Menu:
             pygame.draw.rect(s, (100, 100, 100), cancel_rect)
             s.blit(cancel_txt, (cancel_rect.x + (cancel_rect.w - cancel_txt.get_width()) // 2, cancel_rect.y + (cancel_rect.h - cancel_txt.get_height()) // 2))
 
+            # everything drawn above follows from these
+            ui_state = ('create', ox, start_y, self.create_input, int(self._create_scroll_x))
+
         else:
+            # labels are collected and drawn with one blits() call; the
+            # underlines sit below their label and never overlap another
+            labels = []
+            underline_ws = []
+            underline_h = 6
             for i, txt in enumerate(self.options):
                 ty = start_y + i * self._option_spacing
                 color = (240, 240, 240) if i == self.selected else (200, 200, 200)
-                rendered = font.render(txt, True, color)
-                s.blit(rendered, (ox, ty - rendered.get_height() // 2))
+                rendered = self._render(font, txt, color)
+                half_h = rendered.get_height() // 2
+                labels.append((rendered, (ox, ty - half_h)))
 
                 # underline
-                tw = rendered.get_width()
-                underline_h = 6
                 prog = self.underline_progress[i]
                 if prog > 0.001:
-                    uw = int(tw * prog)
-                    ux = ox
-                    uy = ty + rendered.get_height() // 2 + 6
-                    underline_rect = pygame.Rect(ux, uy, uw, underline_h)
+                    uw = int(rendered.get_width() * prog)
                     # white underline for selected option
-                    pygame.draw.rect(s, (255, 255, 255), underline_rect)
+                    pygame.draw.rect(s, (255, 255, 255), (ox, ty + half_h + 6, uw, underline_h))
+                    underline_ws.append(uw)
+                else:
+                    underline_ws.append(0)
+            s.blits(labels, False)
+
+            # everything drawn above follows from these
+            ui_state = ('list', ox, start_y, self.selected, tuple(self.options), tuple(underline_ws))
 
         # Scale the design surface (UI-only) and blit on top of the already
         # drawn full-window background.
@@ -441,10 +508,24 @@ class Menu:
         combined = base_scale * self.zoom
         sw = max(1, int(round(self.design_w * combined)))
         sh = max(1, int(round(self.design_h * combined)))
-        try:
-            scaled = pygame.transform.smoothscale(s, (sw, sh))
-        except Exception:
+        if (sw, sh) == s.get_size():
+            # 1:1 (window matches the design size and the zoom has settled)
+            scaled = s
+        elif abs(self.zoom - self.zoom_target) > 2e-3:
+            # zoom is still animating; a nearest-neighbour scale is several
+            # times cheaper and the difference isn't visible in motion
             scaled = pygame.transform.scale(s, (sw, sh))
+        else:
+            # settled: smoothscale only when the size or the drawn UI
+            # changes (selection, underline, typing), else reuse the result
+            key = (sw, sh, ui_state)
+            if key != self._scaled_key:
+                try:
+                    self._scaled_ui = pygame.transform.smoothscale(s, (sw, sh))
+                except Exception:
+                    self._scaled_ui = pygame.transform.scale(s, (sw, sh))
+                self._scaled_key = key
+            scaled = self._scaled_ui
 
         # Center scaled UI surface on screen (same origin used for background)
         aw = surf.get_width()
@@ -456,6 +537,7 @@ class Menu:
 
         # Slight full-screen tint to darken the background subtly for
         # readability without a hard rectangle behind the options.
-        tint = pygame.Surface((aw, ah), pygame.SRCALPHA)
-        tint.fill((0, 0, 0, 64))
-        surf.blit(tint, (0, 0))
+        if self._tint is None or self._tint.get_size() != (aw, ah):
+            self._tint = pygame.Surface((aw, ah), pygame.SRCALPHA)
+            self._tint.fill((0, 0, 0, 64))
+        surf.blit(self._tint, (0, 0))
@@ -15,6 +15,8 @@ class Particle :
         self .prev =pygame .math .Vector2 (pos )
         self .acc =pygame .math .Vector2 (0 ,0 )
         self .mass =mass 
+        # mass never changes after construction; collision code uses 1/mass
+        self .inv_mass =1.0 /max (mass ,1e-6 )
 
     def apply_force (self ,f ):
         self .acc +=f /max (self .mass ,1e-6 )
@@ -27,6 +29,23 @@ class Particle :
 
         self .acc .update (0 ,0 )
 
+    def integrate (self ,dt ,gravity_y =0.0 ):
+        """Verlet step with a constant downward acceleration folded in.
+
+        Equivalent to apply_force((0, gravity_y * mass)) + update(dt) but
+        works on plain floats instead of building force vectors.
+        """
+        pos =self .pos 
+        prev =self .prev 
+        acc =self .acc 
+        dt2 =dt *dt 
+        px ,py =pos .x ,pos .y 
+        nx =2.0 *px -prev .x +acc .x *dt2 
+        ny =2.0 *py -prev .y +(acc .y +gravity_y )*dt2 
+        prev .update (px ,py )
+        pos .update (nx ,ny )
+        acc .update (0 ,0 )
+
 
 class NPC :
     """A blocky NPC composed of rectangular parts connected with constraints."""
@@ -129,11 +148,9 @@ class NPC :
             fy =None 
 
 
+        gy =self .gravity .y 
         for p in self .particles :
-            p .apply_force (self .gravity *p .mass )
-
-        for p in self .particles :
-            p .update (dt )
+            p .integrate (dt ,gy )
 
 
         # If standing behaviour is enabled, softly nudge particles toward
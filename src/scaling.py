@@ -12,27 +12,36 @@ DESIGN_H =640
 
 
 _scale =1.0 
+# 1/_scale, kept by init() so to_world multiplies instead of dividing
+_inv_scale =1.0 
 _offset_x =0.0 
 _offset_y =0.0 
 _design_w =DESIGN_W 
 _design_h =DESIGN_H 
+# bumped by init() so callers can cache screen-space sizes per scale
+_scale_version =0 
 
 def init (actual_w :int ,actual_h :int ,design_w :int =DESIGN_W ,design_h :int =DESIGN_H ):
-    global _scale ,_offset_x ,_offset_y ,_design_w ,_design_h 
+    global _scale ,_inv_scale ,_offset_x ,_offset_y ,_design_w ,_design_h ,_scale_version 
     _design_w =design_w 
     _design_h =design_h 
     sx =actual_w /float (design_w )
     sy =actual_h /float (design_h )
 
     _scale =min (sx ,sy )
+    _inv_scale =1.0 /_scale 
     scaled_w =design_w *_scale 
     scaled_h =design_h *_scale 
     _offset_x =(actual_w -scaled_w )/2.0 
     _offset_y =(actual_h -scaled_h )/2.0 
+    _scale_version +=1 
 
 def get_scale ()->float :
     return _scale 
 
+def get_scale_version ()->int :
+    return _scale_version 
+
 def get_offset ()->Tuple [float ,float ]:
     return (_offset_x ,_offset_y )
 
@@ -55,14 +64,14 @@ def to_screen_length (length :float )->int :
 
 def to_world (screen_pos )->Tuple [float ,float ]:
     sx ,sy =screen_pos 
-    x =(sx -_offset_x )/_scale 
-    y =(sy -_offset_y )/_scale 
+    x =(sx -_offset_x )*_inv_scale 
+    y =(sy -_offset_y )*_inv_scale 
     return (x ,y )
 
 def to_world_vec (vec ):
     if Vector2 is tuple :
         return to_world ((vec [0 ],vec [1 ]))
     v =Vector2 (vec )
-    x =(v .x -_offset_x )/_scale 
-    y =(v .y -_offset_y )/_scale 
+    x =(v .x -_offset_x )*_inv_scale 
+    y =(v .y -_offset_y )*_inv_scale 
     return Vector2 (x ,y )
@@ -15,6 +15,9 @@ class Thruster:
         self.p = Particle(pos, mass=mass)
         self.size = size
         self.icon = icon
+        # icon scaled for the current screen size and the (icon, px) it is for
+        self._icon_img = None
+        self._icon_img_key = None
         self.color = (180, 140, 40)
         self.outline = (90, 60, 10)
         self.thrust_power = 1200.0
@@ -27,10 +30,8 @@ class Thruster:
 
     def update(self, dt, floor_y=None, other_bricks=None):
         # simple gravity + floor collision similar to Brick
-        gravity = pygame.math.Vector2(0, 900)
         try:
-            self.p.apply_force(gravity * self.p.mass)
-            self.p.update(dt)
+            self.p.integrate(dt, 900.0)
         except Exception:
             pass
 
@@ -109,8 +110,11 @@ class Thruster:
         if self.icon:
             ps = max(20, scaling.to_screen_length(self.size))
             try:
-                img = pygame.transform.scale(self.icon, (ps, ps))
-                surf.blit(img, (int(center.x - ps // 2), int(center.y - ps // 2)))
+                key = (id(self.icon), ps)
+                if key != self._icon_img_key:
+                    self._icon_img = pygame.transform.scale(self.icon, (ps, ps))
+                    self._icon_img_key = key
+                surf.blit(self._icon_img, (int(center.x - ps // 2), int(center.y - ps // 2)))
                 return
             except Exception:
                 pass
@@ -270,10 +270,8 @@ class Bike:
     def update(self, dt, floor_y=None, other_bricks=None):
         # integrate parts
         self._time += dt
-        gravity = pygame.math.Vector2(0, 900)
         for p in self.parts:
-            p.apply_force(gravity * getattr(p, 'mass', 1.0))
-            p.update(dt)
+            p.integrate(dt, 900.0)
 
         # constraint solve (iterative) - increase iterations for stability
         for _ in range(12):
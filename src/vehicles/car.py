@@ -91,6 +91,9 @@ class Car:
 		# scale it to match `size`. Otherwise we use procedural drawing.
 		self.sprite = None
 		self._sprite_orig_size = None
+		# sprite smoothscaled to the last on-screen size it was drawn at
+		self._sprite_scaled = None
+		self._sprite_scaled_size = None
 		try:
 			base = os.path.join(os.path.dirname(__file__), 'assets')
 			path = os.path.join(base, 'car.png')
@@ -237,10 +240,8 @@ class Car:
 
 	def update(self, dt, floor_y=None, other_bricks=None):
 		self._time += dt
-		gravity = pygame.math.Vector2(0, 900)
 		for p in self.parts:
-			p.apply_force(gravity * getattr(p, 'mass', 1.0))
-			p.update(dt)
+			p.integrate(dt, 900.0)
 
 		for _ in range(10):
 			for ia, ib, rest in list(self.constraints):
@@ -485,7 +486,11 @@ class Car:
 					target_w = max(2, scaling.to_screen_length(self.size * 0.9))
 					scale = target_w / float(orig_w)
 					target_h = max(2, int(orig_h * scale))
-					scaled = pygame.transform.smoothscale(self.sprite, (int(target_w), int(target_h)))
+					size_px = (int(target_w), int(target_h))
+					if size_px != self._sprite_scaled_size:
+						self._sprite_scaled = pygame.transform.smoothscale(self.sprite, size_px)
+						self._sprite_scaled_size = size_px
+					scaled = self._sprite_scaled
 					sw = scaling.to_screen_vec(self.p.pos)
 					# anchor: horizontally center on p, and vertically place so
 					# wheels line up with wheel particles (estimate offset)
@@ -18,6 +18,17 @@ class WeldingTool :
         self .current_group =None 
         self .max_group_size =100 
 
+    def reset (self ,pos ,icon =None ):
+        """Prepare a pooled welding tool for reuse at pos."""
+        self .pos =pygame .math .Vector2 (pos )
+        self .held =False 
+        self .icon =icon 
+        self .welded =[]
+        self .joints =[]
+        self ._last_weld_target =None 
+        self .weld_groups ={}
+        self .current_group =None 
+
     def draw (self ,surf ):
 
         center =scaling .to_screen_vec (self .pos )
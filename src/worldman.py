@@ -1,6 +1,7 @@
 import os
 import json
 import atexit
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional, Dict, Any, Callable, MutableMapping, MutableSequence
 
 
@@ -14,7 +15,9 @@ class WorldManager:
     - Load and save world data (dict) in memory.
 
     This is intentionally small and synchronous — suitable for the menu
-    and simple autosave calls from the game.
+    and simple autosave calls from the game. Autosaves are batched: call
+    flush(dt) every frame and pending changes are written off the game
+    thread; save_now()/close() still write synchronously.
     """
 
     def __init__(self, project_root: Optional[str] = None, autosave: bool = True):
@@ -32,6 +35,15 @@ class WorldManager:
         self.current_data: Optional[Dict[str, Any]] = None
         # whether modifications should be persisted automatically
         self.autosave = bool(autosave)
+        # autosaves are coalesced: mutations only mark the world dirty and
+        # flush() writes it once it has been dirty for save_delay seconds
+        self.save_delay = 0.5
+        self._dirty = False
+        self._dirty_time = 0.0
+        # batched saves are written on one background thread (created on
+        # first use); _save_future is the latest queued write
+        self._save_exec: Optional[ThreadPoolExecutor] = None
+        self._save_future = None
 
     # --- autosave helpers -------------------------------------------------
 
@@ -41,8 +53,26 @@ class WorldManager:
         It's a no-op when autosave is disabled.
         """
         if self.autosave:
-            # ignore return value here; callers can still call save_world explicitly
-            self.save_world()
+            self.mark_dirty()
+
+    def mark_dirty(self) -> None:
+        """Schedule the current world for the next flush()."""
+        self._dirty = True
+
+    def flush(self, dt: float = 0.0) -> bool:
+        """Advance the autosave timer by dt and save if it has run out.
+
+        Call once per frame. Rapid edits (e.g. spawning many bricks) are
+        written in one go instead of once per mutation. Returns True when a
+        save happened.
+        """
+        self._collect_save()
+        if not self._dirty:
+            return False
+        self._dirty_time += dt
+        if self._dirty_time < self.save_delay:
+            return False
+        return self.save_world_async()
 
     # --- world file operations --------------------------------------------
 
@@ -92,6 +122,11 @@ class WorldManager:
         return self.load_world(name)
 
     def load_world(self, name: str) -> bool:
+        # don't read a file a background save is still writing
+        self._wait_for_save()
+        # write out edits still waiting for flush() before switching away
+        if self._dirty:
+            self.save_world()
         path = self._world_path(name)
         if not os.path.exists(path):
             return False
@@ -101,6 +136,8 @@ class WorldManager:
         except Exception:
             return False
         self.current_name = name
+        self._dirty = False
+        self._dirty_time = 0.0
         # Wrap the loaded data so mutations autosave
         if isinstance(data, dict):
             self.current_data = AutoSavingDict(data, self._save_callback)
@@ -120,12 +157,61 @@ class WorldManager:
         try:
             # convert any AutoSaving* wrappers back into plain structures
             plain = _to_plain(self.current_data)
-            with open(path, 'w', encoding='utf-8') as f:
-                json.dump(plain, f, indent=2)
         except Exception:
             return False
+        # let a queued background write finish first so it can't land on
+        # top of this newer one
+        self._wait_for_save()
+        if not _write_json(path, plain):
+            return False
+        self._dirty = False
+        self._dirty_time = 0.0
+        return True
+
+    def save_world_async(self) -> bool:
+        """Snapshot the current world and write it on a background thread.
+
+        The snapshot is taken here, so later mutations don't race the
+        write. Returns False if there is nothing to save or the snapshot
+        failed; a failed write marks the world dirty again.
+        """
+        if not self.current_name or self.current_data is None:
+            return False
+        path = self._world_path(self.current_name)
+        try:
+            plain = _to_plain(self.current_data)
+        except Exception:
+            return False
+        if self._save_exec is None:
+            self._save_exec = ThreadPoolExecutor(max_workers=1)
+        # a still-pending earlier write is superseded by this newer snapshot
+        self._save_future = self._save_exec.submit(_write_json, path, plain)
+        self._dirty = False
+        self._dirty_time = 0.0
         return True
 
+    def _collect_save(self, wait: bool = False) -> None:
+        """Pick up the result of the last background write.
+
+        Runs on the main thread (from flush() or _wait_for_save()) so the
+        dirty state is never touched by the writer thread. A failed write
+        marks the world dirty again. Without wait, a write that is still
+        running is left alone.
+        """
+        future = self._save_future
+        if future is None or (not wait and not future.done()):
+            return
+        self._save_future = None
+        try:
+            ok = future.result()
+        except Exception:
+            ok = False
+        if not ok:
+            self.mark_dirty()
+
+    def _wait_for_save(self) -> None:
+        self._collect_save(wait=True)
+
     def save_now(self) -> bool:
         """Explicitly persist the current world immediately."""
         return self.save_world()
@@ -150,7 +236,7 @@ class WorldManager:
             # use AutoSavingList when creating new list
             self.current_data['npcs'] = AutoSavingList([], self._save_callback)
         self.current_data['npcs'].append(npc)
-        # append triggers autosave; return True
+        # append marks the world dirty for the next flush; return True
         return True
 
     def add_brick(self, brick: Dict[str, Any]) -> bool:
@@ -204,9 +290,19 @@ class WorldManager:
         if self.current_data is None:
             return False
         self.current_data[key] = value
-        # assignment triggers autosave via wrappers
+        # assignment marks the world dirty via wrappers
         return True
 
+def _write_json(path: str, data: Any) -> bool:
+    """Dump `data` as JSON to `path`; returns False on any error."""
+    try:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+    except Exception:
+        return False
+    return True
+
+
 def _wrap_value(value, save_cb: Callable[[], None]):
     """Wrap dicts/lists with autosaving wrappers recursively."""
     if isinstance(value, dict):